@@ -0,0 +1,130 @@
+import uuid
+import wave
+import typing
+import threading
+import numpy as np
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor
+)
+from ._utils import (
+    PathL as Path,
+    os
+)
+from . import _utils
+
+# shared by all videos, the audio of several videos is prepared at the same time
+_executor: ThreadPoolExecutor | None = None
+# number of videos that use each cached audio file, a file in use is never removed
+_references: dict[str, int] = {}
+_references_lock = threading.Lock()
+
+def submit_audio_job(function: typing.Callable[[], None]) -> Future:
+    global _executor
+
+    if _executor is None:
+        _executor = ThreadPoolExecutor(thread_name_prefix='pygvideo-audio')
+
+    return _executor.submit(function)
+
+def decode_audio(audio: _utils.SupportsAudioClip, fps: int, logger=None) -> np.ndarray:
+    # the whole soundtrack as 16-bit pcm with the shape (samples, channels), decoded once in chunks
+    samples = None
+    position = 0
+
+    for chunk in audio.iter_chunks(chunksize=50000, fps=fps, quantize=True, nbytes=2, logger=logger):
+        chunk = chunk.reshape((len(chunk), -1))
+
+        if samples is None:
+            samples = np.empty((int(fps * audio.duration), chunk.shape[1]), dtype=np.int16)
+
+        samples[position:position + len(chunk)] = chunk
+        position += len(chunk)
+
+    if samples is None:
+        return np.zeros((0, 2), dtype=np.int16)
+
+    return samples[:position]
+
+def write_wav(file: _utils.Path, samples: np.ndarray, fps: int) -> None:
+    # wav is little endian, the samples are written in one bulk write without any encoding
+    samples = np.ascontiguousarray(samples, dtype='<i2')
+    # write to a temporary file first, so the audio file only exists once it's complete. The name is unique
+    # because several videos can write the same cached audio at the same time
+    temp_file = f'{file}.{uuid.uuid4().hex}.tmp'
+
+    with wave.open(temp_file, 'wb') as wav_file:
+        wav_file.setnchannels(samples.shape[1])
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(fps)
+        wav_file.writeframes(memoryview(samples).cast('B'))
+
+    os.replace(temp_file, file)
+
+def read_wav(file: _utils.Path) -> tuple[np.ndarray, int] | None:
+    # samples and frame rate of a wav file written by write_wav, nothing is decoded
+    try:
+        with wave.open(str(file), 'rb') as wav_file:
+            if wav_file.getsampwidth() != 2:
+                return None
+            channels = wav_file.getnchannels()
+            fps = wav_file.getframerate()
+            data = wav_file.readframes(wav_file.getnframes())
+    except (OSError, EOFError, wave.Error):
+        return None
+
+    return (np.frombuffer(data, dtype='<i2').reshape((-1, channels)), fps)
+
+def fit_samples(samples: np.ndarray, length: int, channels: int | None = None) -> np.ndarray:
+    # trim or pad the samples with silence to length, mono samples are repeated to the other channels
+    if channels is not None and samples.shape[1] != channels:
+        samples = np.repeat(samples[:, :1], channels, axis=1)
+
+    if len(samples) >= length:
+        return samples[:length]
+
+    return np.concatenate((samples, np.zeros((length - len(samples), samples.shape[1]), dtype=samples.dtype)))
+
+def acquire_audio(file: _utils.Path) -> None:
+    with _references_lock:
+        _references[str(file)] = _references.get(str(file), 0) + 1
+
+    try:
+        # the modification time is the last time the file was used, the oldest files are removed first
+        os.utime(file)
+    except OSError:
+        pass
+
+def release_audio(file: _utils.Path) -> None:
+    with _references_lock:
+        if (count := _references.get(str(file), 0) - 1) > 0:
+            _references[str(file)] = count
+        else:
+            _references.pop(str(file), None)
+
+def evict_audio_cache(directory: _utils.Path, max_size: int) -> None:
+    # remove the least recently used audio files until the cache fits in max_size bytes
+    files = []
+
+    for file in Path(directory).glob('*.audio.wav'):
+        try:
+            stat = file.stat()
+        except OSError:
+            continue
+        files.append((stat.st_mtime, stat.st_size, file))
+
+    total_size = sum(size for _, size, _ in files)
+
+    for _, size, file in sorted(files):
+        if total_size <= max_size:
+            break
+
+        with _references_lock:
+            if str(file) in _references:
+                continue
+
+        try:
+            os.remove(file)
+            total_size -= size
+        except OSError:
+            pass
@@ -0,0 +1,112 @@
+import pygame
+import typing
+from collections import OrderedDict
+
+CacheKey = tuple[int, tuple[int, int] | None]
+
+class FrameCache:
+
+    def __init__(self, max_frames: int | None = None, max_bytes: int | None = None) -> None:
+        # None means there is no limit (only limited by the memory of the device)
+        self.__max_frames = max_frames
+        self.__max_bytes = max_bytes
+        self.__frames: OrderedDict[CacheKey, pygame.Surface] = OrderedDict()
+        # pinned frames are not removed by trim (e.g. frames from create_cache_frame)
+        self.__pinned: set[CacheKey] = set()
+        self.__bytes = 0
+        self.__last_bytes = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def __contains__(self, key: CacheKey) -> bool:
+        return key in self.__frames
+
+    def __iter__(self) -> typing.Iterator[CacheKey]:
+        return iter(self.__frames)
+
+    def __len__(self) -> int:
+        return len(self.__frames)
+
+    @staticmethod
+    def get_surface_bytes(surface: pygame.Surface) -> int:
+        return surface.get_pitch() * surface.get_height()
+
+    def __is_over(self, frames: int, bytes: int) -> bool:
+        return ((self.__max_frames is not None and frames > self.__max_frames) or
+                (self.__max_bytes is not None and bytes > self.__max_bytes))
+
+    def get(self, key: CacheKey) -> pygame.Surface | None:
+        surface = self.__frames.get(key)
+
+        if surface is None:
+            self.__misses += 1
+        else:
+            self.__hits += 1
+            # mark as the most recently used
+            self.__frames.move_to_end(key)
+
+        return surface
+
+    def add(self, key: CacheKey, surface: pygame.Surface, pin: bool = False) -> None:
+        surface_bytes = self.get_surface_bytes(surface)
+
+        if self.__is_over(1, surface_bytes):
+            # the frame itself doesn't fit the budget
+            return
+
+        self.remove(key)
+
+        # evict the least recently used frames until the new frame fits the budget
+        while self.__frames and self.__is_over(len(self.__frames) + 1, self.__bytes + surface_bytes):
+            evicted_key, evicted_surface = self.__frames.popitem(last=False)
+            self.__bytes -= self.get_surface_bytes(evicted_surface)
+            self.__pinned.discard(evicted_key)
+            self.__evictions += 1
+
+        self.__frames[key] = surface
+        self.__bytes += surface_bytes
+        self.__last_bytes = surface_bytes
+
+        if pin:
+            self.__pinned.add(key)
+
+    def remove(self, key: CacheKey) -> None:
+        if (surface := self.__frames.pop(key, None)) is not None:
+            self.__bytes -= self.get_surface_bytes(surface)
+            self.__pinned.discard(key)
+
+    def trim(self, start: int, stop: int) -> None:
+        # remove the frames outside the range of frame index [start, stop), except pinned frames
+        for key in [key for key in self.__frames if not start <= key[0] < stop and key not in self.__pinned]:
+            self.remove(key)
+            self.__evictions += 1
+
+    def clear(self) -> None:
+        self.__frames.clear()
+        self.__pinned.clear()
+        self.__bytes = 0
+
+    def copy(self) -> 'FrameCache':
+        cache = FrameCache(self.__max_frames, self.__max_bytes)
+
+        for key, surface in self.__frames.items():
+            cache.add(key, surface, pin=key in self.__pinned)
+
+        return cache
+
+    def get_stats(self) -> dict[str, int | None]:
+        return {
+            'frames': len(self.__frames),
+            'bytes': self.__bytes,
+            'max_frames': self.__max_frames,
+            'max_bytes': self.__max_bytes,
+            'hits': self.__hits,
+            'misses': self.__misses,
+            'evictions': self.__evictions
+        }
+
+    @property
+    def is_full(self) -> bool:
+        # full if the next frame (in the same size as the last one) can't be added without eviction
+        return self.__is_over(len(self.__frames) + 1, self.__bytes + self.__last_bytes)
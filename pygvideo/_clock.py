@@ -0,0 +1,253 @@
+import abc
+import time
+import typing
+import pygame
+import threading
+
+class Clock(abc.ABC):
+
+    # the playback clock of a video, the times are in seconds of the video timeline. Subclass it to drive
+    # the video by another timeline, the clock is prepared with the duration of the video in Video.prepare.
+    # Every method is called from the thread of draw_and_update, except peek that is also called from the
+    # prefetch worker thread (set_prefetch)
+    duration: float | None = None
+
+    def prepare(self, duration: float) -> None:
+        self.duration = duration
+
+    @abc.abstractmethod
+    def play(self, start: float = 0) -> None: ...
+
+    @abc.abstractmethod
+    def stop(self) -> None: ...
+
+    @abc.abstractmethod
+    def pause(self) -> None: ...
+
+    @abc.abstractmethod
+    def unpause(self) -> None: ...
+
+    @abc.abstractmethod
+    def seek(self, pos: float, paused: bool = False) -> None: ...
+
+    @abc.abstractmethod
+    def get_time(self) -> float | None:
+        # None if the clock isn't running (stopped or the end of the video)
+        ...
+
+    @abc.abstractmethod
+    def peek(self) -> float | None:
+        # same as get_time without changing the state of the clock, it must be safe to call from another thread
+        ...
+
+    @abc.abstractmethod
+    def is_busy(self) -> bool: ...
+
+    def is_ended(self, time: float) -> bool:
+        return self.duration is not None and time >= self.duration
+
+class MixerClock(Clock):
+
+    # the time of the audio that is played by pygame.mixer.music, get_pos restarts from 0 on every play.
+    # The mixer position only moves once per audio buffer, if smooth is True the time is counted with
+    # time.perf_counter and slowly corrected to the mixer position so every frame lasts the same time
+
+    def __init__(self, smooth: bool = True, max_drift: float = 0.1) -> None:
+        self.__smooth = smooth
+        # the time is set to the mixer position if they are more than max_drift seconds apart
+        self.__max_drift = max_drift
+        self.__offset = 0.0
+        # the smoothing state is changed by get_time and the control methods
+        self.__lock = threading.Lock()
+        self.__reset()
+
+    def __reset(self) -> None:
+        # perf_counter value at the time 0 of the video
+        self.__origin = None
+        self.__paused_at = None
+        self.__last_mixer_time = None
+        self.__last_time = None
+
+    def __get_mixer_time(self) -> float | None:
+        music_pos = pygame.mixer.music.get_pos()
+
+        if music_pos == -1:
+            return None
+
+        return self.__offset + music_pos / 1000
+
+    def play(self, start: float = 0) -> None:
+        with self.__lock:
+            self.__offset = start
+            self.__reset()
+            pygame.mixer.music.play(start=start)
+
+    def stop(self) -> None:
+        with self.__lock:
+            self.__offset = 0.0
+            self.__reset()
+            pygame.mixer.music.stop()
+
+    def pause(self) -> None:
+        with self.__lock:
+            if self.__paused_at is None:
+                self.__paused_at = time.perf_counter()
+            pygame.mixer.music.pause()
+
+    def unpause(self) -> None:
+        with self.__lock:
+            if self.__paused_at is not None:
+                if self.__origin is not None:
+                    self.__origin += time.perf_counter() - self.__paused_at
+                self.__paused_at = None
+            pygame.mixer.music.unpause()
+
+    def seek(self, pos: float, paused: bool = False) -> None:
+        with self.__lock:
+            self.__offset = pos
+            self.__reset()
+            pygame.mixer.music.stop()
+            pygame.mixer.music.play(start=pos)
+            if paused:
+                self.__paused_at = time.perf_counter()
+                pygame.mixer.music.pause()
+
+    def peek(self) -> float | None:
+        # the mixer position without smoothing, nothing is changed
+        with self.__lock:
+            mixer_time = self.__get_mixer_time()
+
+        return None if mixer_time is None or self.is_ended(mixer_time) else mixer_time
+
+    def get_time(self) -> float | None:
+        with self.__lock:
+            return self.__get_smooth_time()
+
+    def __get_smooth_time(self) -> float | None:
+        if (mixer_time := self.__get_mixer_time()) is None:
+            return None
+
+        if not self.__smooth:
+            return mixer_time
+
+        now = self.__paused_at if self.__paused_at is not None else time.perf_counter()
+
+        if self.__origin is None:
+            self.__origin = now - mixer_time
+
+        elif mixer_time != self.__last_mixer_time:
+            # the mixer position moved, correct the drift of the counted time
+            drift = mixer_time - (now - self.__origin)
+            if abs(drift) > self.__max_drift:
+                self.__origin = now - mixer_time
+            else:
+                # a part of the drift per update, so the correction doesn't make the frames uneven
+                self.__origin -= drift * 0.1
+
+        self.__last_mixer_time = mixer_time
+
+        # never go back in time, a frame that is already shown is not shown again
+        current_time = now - self.__origin
+        if self.__last_time is not None:
+            current_time = max(current_time, self.__last_time)
+        self.__last_time = current_time
+
+        return None if self.is_ended(current_time) else current_time
+
+    def is_busy(self) -> bool:
+        return pygame.mixer.music.get_busy()
+
+class PerfCounterClock(Clock):
+
+    # the time is counted with time.perf_counter, used for videos without audio and runs without a mixer
+
+    def __init__(self, duration: float | None = None) -> None:
+        self.duration = duration
+        # perf_counter value at the time 0 of the video
+        self.__origin = None
+        self.__paused_at = None
+
+    def __now(self) -> float:
+        return self.__paused_at if self.__paused_at is not None else time.perf_counter()
+
+    def play(self, start: float = 0) -> None:
+        self.__origin = time.perf_counter() - start
+        self.__paused_at = None
+
+    def stop(self) -> None:
+        self.__origin = None
+        self.__paused_at = None
+
+    def pause(self) -> None:
+        if self.__origin is not None and self.__paused_at is None:
+            self.__paused_at = time.perf_counter()
+
+    def unpause(self) -> None:
+        if self.__paused_at is not None:
+            self.__origin += time.perf_counter() - self.__paused_at
+            self.__paused_at = None
+
+    def seek(self, pos: float, paused: bool = False) -> None:
+        now = time.perf_counter()
+        self.__origin = now - pos
+        self.__paused_at = now if paused else None
+
+    def get_time(self) -> float | None:
+        if self.__origin is None:
+            return None
+
+        current_time = self.__now() - self.__origin
+
+        return None if self.is_ended(current_time) else current_time
+
+    def peek(self) -> float | None:
+        # get_time doesn't change anything
+        return self.get_time()
+
+    def is_busy(self) -> bool:
+        # same as pygame.mixer.music.get_busy, the clock isn't busy while paused
+        return self.__paused_at is None and self.get_time() is not None
+
+class CallbackClock(Clock):
+
+    # the time is given by the caller (an external timeline, a network master clock, a fixed step for
+    # rendering, etc.). The timeline belongs to the caller, so play, pause and seek don't move it.
+    # function is only called by get_time, from the thread of draw_and_update
+
+    def __init__(self, function: typing.Callable[[], float | None]) -> None:
+        self.__function = function
+        self.__running = False
+        # the last time of get_time, returned by peek so function isn't called from another thread
+        self.__last_time = None
+
+    def play(self, start: float = 0) -> None:
+        self.__running = True
+
+    def stop(self) -> None:
+        self.__running = False
+        self.__last_time = None
+
+    def pause(self) -> None:
+        pass
+
+    def unpause(self) -> None:
+        pass
+
+    def seek(self, pos: float, paused: bool = False) -> None:
+        pass
+
+    def get_time(self) -> float | None:
+        if not self.__running or (current_time := self.__function()) is None:
+            self.__last_time = None
+            return None
+
+        current_time = max(current_time, 0)
+        self.__last_time = None if self.is_ended(current_time) else current_time
+
+        return self.__last_time
+
+    def peek(self) -> float | None:
+        return self.__last_time if self.__running else None
+
+    def is_busy(self) -> bool:
+        return self.get_time() is not None
@@ -1,2 +1,19 @@
 AUDIO_STANDARD_FRAME_RATE = 44100  # standard frame rate, (44100 Hz)
-MIN_LOW_FPS = 24  # low FPS standard recommendation
\ No newline at end of file
+MIN_LOW_FPS = 24  # low FPS standard recommendation
+
+# moviepy video effects and clip methods that only change the frames, the audio of the clip stays the same
+VIDEO_ONLY_EFFECTS = frozenset({
+    'BlackAndWhite', 'Blink', 'Crop', 'CrossFadeIn', 'CrossFadeOut', 'EvenSize', 'FadeIn', 'FadeOut',
+    'FreezeRegion', 'GammaCorrection', 'HeadBlur', 'InvertColors', 'LumContrast', 'Margin', 'MaskColor',
+    'MasksAnd', 'MasksOr', 'MirrorX', 'MirrorY', 'MultiplyColor', 'Painting', 'Resize', 'Rotate', 'Scroll',
+    'SlideIn', 'SlideOut', 'SuperSample', 'cropped', 'resized', 'rotated', 'with_fps', 'with_opacity',
+    'with_position', 'with_mask', 'without_mask', 'with_layer_index'
+})
+
+# number of the last presented frames kept for the a/v drift statistics
+SYNC_STATS_FRAMES = 1000
+# late frames in a row before the late-frame policy of draw_and_update is used, and frames on time in a row
+# before it stops
+LATE_FRAME_COUNT = 3
+# scale of the decode resolution of the late-frame policy resolution
+LATE_FRAME_SCALE = 0.5
\ No newline at end of file
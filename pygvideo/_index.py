@@ -0,0 +1,143 @@
+import re
+import subprocess as sp
+import numpy as np
+from moviepy.config import FFMPEG_BINARY
+from moviepy.tools import (
+    cross_platform_popen_params,
+    ffmpeg_escape_filename
+)
+from ._store import get_source_key
+from ._utils import (
+    PathL as Path,
+    os
+)
+from . import _utils
+
+class FrameIndex:
+
+    def __init__(self, times: np.ndarray, keyframes: np.ndarray) -> None:
+        # times is the presentation time (seconds) of each frame, keyframes is the frame index of each keyframe
+        self.__times = times
+        self.__keyframes = keyframes
+
+    def __len__(self) -> int:
+        return len(self.__times)
+
+    @classmethod
+    def from_file(cls, filename: _utils.Path) -> 'FrameIndex':
+        # demux the packets without decoding them, framecrc prints the flags (F=) of the packets that are not keyframes
+        cmd = [
+            FFMPEG_BINARY,
+            '-hide_banner',
+            '-i', ffmpeg_escape_filename(filename),
+            '-map', '0:v:0',
+            '-c', 'copy',
+            '-f', 'framecrc',
+            '-'
+        ]
+        popen_params = cross_platform_popen_params(
+            {
+                'stdout': sp.PIPE,
+                'stderr': sp.DEVNULL,
+                'stdin': sp.DEVNULL
+            }
+        )
+
+        with sp.Popen(cmd, **popen_params) as proc:
+            output = proc.stdout.read().decode('utf-8', errors='ignore')
+
+        time_base = re.search(r'^#tb 0: (\d+)/(\d+)', output, re.MULTILINE)
+
+        if proc.returncode != 0 or time_base is None:
+            raise OSError(f'failed to read the packets of {filename!r}')
+
+        pts = []
+        keys = []
+
+        for line in output.splitlines():
+            if line.startswith('#'):
+                continue
+
+            fields = [field.strip() for field in line.split(',')]
+            if len(fields) < 6 or fields[2] == str(np.iinfo(np.int64).min):
+                # packet without presentation timestamp
+                continue
+
+            flags = next((int(field[2:], 16) for field in fields[6:] if field.startswith('F=')), 1)
+            if flags & 4:
+                # discarded packet (e.g. outside the edit list), the frame is never shown
+                continue
+
+            pts.append(int(fields[2]))
+            keys.append(bool(flags & 1))
+
+        if not pts:
+            raise OSError(f'{filename!r} has no video packets')
+
+        # packets are in decoding order, sort them in presentation order
+        order = np.argsort(pts, kind='stable')
+        times = np.asarray(pts, dtype=np.float64)[order] * (int(time_base.group(1)) / int(time_base.group(2)))
+        keyframes = np.flatnonzero(np.asarray(keys, dtype=np.bool_)[order])
+
+        if len(keyframes) == 0 or keyframes[0] != 0:
+            # the first frame can always be decoded from the start of the file
+            keyframes = np.concatenate(([0], keyframes))
+
+        return cls(times, keyframes)
+
+    @classmethod
+    def load(cls, file: _utils.Path) -> 'FrameIndex':
+        with np.load(file) as data:
+            return cls(data['times'], data['keyframes'])
+
+    def save(self, file: _utils.Path) -> None:
+        # write to a temporary file first, so a broken index is never loaded
+        temp_file = Path(f'{file}.tmp.npz')
+        np.savez(temp_file, times=self.__times, keyframes=self.__keyframes)
+        os.replace(temp_file, file)
+
+    def get_frame_index(self, time: _utils.SecondsValue) -> int:
+        # index of the frame displayed at the time
+        return max(int(np.searchsorted(self.__times, time + 1e-6, side='right')) - 1, 0)
+
+    def get_time(self, frame_index: int) -> float:
+        return float(self.__times[frame_index])
+
+    def get_keyframe(self, frame_index: int) -> int:
+        # the nearest keyframe at or before the frame, decoding starts from this frame
+        return int(self.__keyframes[max(int(np.searchsorted(self.__keyframes, frame_index, side='right')) - 1, 0)])
+
+    @property
+    def total_frame(self) -> int:
+        return len(self.__times)
+
+    @property
+    def keyframes(self) -> np.ndarray:
+        return self.__keyframes
+
+    @property
+    def times(self) -> np.ndarray:
+        return self.__times
+
+def load_frame_index(filename: _utils.Path, directory: _utils.Path) -> FrameIndex | None:
+    # the index is built once for each file and saved in the cache directory
+    if (key := get_source_key(filename, 'frame-index')) is None:
+        return None
+
+    file = Path(directory) / f'{key}.pts.npz'
+
+    try:
+        return FrameIndex.load(file)
+    except (OSError, ValueError, KeyError):
+        pass
+
+    index = FrameIndex.from_file(filename)
+
+    try:
+        file.parent.mkdir(parents=True, exist_ok=True)
+        index.save(file)
+    except OSError:
+        # the index can still be used without saving it
+        pass
+
+    return index
@@ -0,0 +1,55 @@
+import pygame
+import numpy as np
+
+class SurfacePool:
+
+    def __init__(self, count: int = 2) -> None:
+        # the surfaces are used in turn, the surface returned by get stays valid for count - 1 more calls
+        self.__count = count
+        self.__surfaces: list[pygame.Surface | None] = [None] * count
+        self.__arrays: list[np.ndarray | None] = [None] * count
+        self.__index = -1
+
+    def __next(self) -> int:
+        self.__index = (self.__index + 1) % self.__count
+        return self.__index
+
+    @staticmethod
+    def __get_format(surface: pygame.Surface) -> tuple:
+        return (surface.get_bitsize(), surface.get_masks())
+
+    def get(self, size: tuple[int, int], like: pygame.Surface | None = None) -> pygame.Surface:
+        # like is the surface that will be scaled or copied into the returned surface, transform.scale needs
+        # the same pixel format for the destination surface
+        index = self.__next()
+        surface = self.__surfaces[index]
+
+        if (surface is None or self.__arrays[index] is not None or surface.get_size() != size or
+                (like is not None and self.__get_format(surface) != self.__get_format(like))):
+            surface = pygame.Surface(size, 0, like) if like is not None else pygame.Surface(size)
+            self.__surfaces[index] = surface
+            self.__arrays[index] = None
+
+        return surface
+
+    def get_buffer(self, size: tuple[int, int]) -> tuple[np.ndarray, pygame.Surface]:
+        # rgb24 surface that wraps the returned array, writing to the array changes the surface
+        width, height = size
+        index = self.__next()
+        array = self.__arrays[index]
+
+        if array is None or array.shape != (height, width, 3):
+            array = np.empty((height, width, 3), dtype=np.uint8)
+            self.__arrays[index] = array
+            self.__surfaces[index] = pygame.image.frombuffer(array, size, 'RGB')
+
+        return array, self.__surfaces[index]
+
+    def clear(self) -> None:
+        self.__surfaces = [None] * self.__count
+        self.__arrays = [None] * self.__count
+        self.__index = -1
+
+    @property
+    def count(self) -> int:
+        return self.__count
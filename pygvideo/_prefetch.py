@@ -0,0 +1,138 @@
+import pygame
+import typing
+import threading
+
+class FramePrefetcher:
+
+    def __init__(self,
+                 decode: typing.Callable[[int], pygame.Surface],
+                 target: typing.Callable[[], int | None],
+                 frames: int,
+                 interval: float = 0.005) -> None:
+
+        # decode is called from the worker thread, target returns the frame index of the clock
+        self.__decode = decode
+        self.__target = target
+        self.__frames = frames
+        self.__interval = interval
+        self.__buffer: dict[int, pygame.Surface | None] = dict()
+        self.__condition = threading.Condition()
+        self.__thread = None
+        self.__running = False
+        self.__generation = 0
+        self.__last_underrun = -1
+        self.__hits = 0
+        self.__underruns = 0
+
+    def __worker(self) -> None:
+        while True:
+            with self.__condition:
+                if not self.__running:
+                    return
+
+                target = self.__target()
+
+                if target is None:
+                    self.__condition.wait(self.__interval)
+                    continue
+
+                # remove the frames that have been passed by the clock
+                for index in [i for i in self.__buffer if i < target]:
+                    del self.__buffer[index]
+
+                index = next((i for i in range(target, target + self.__frames) if i not in self.__buffer), None)
+
+                if index is None:
+                    # the ring buffer is full, wait until the clock moves
+                    self.__condition.wait(self.__interval)
+                    continue
+
+                generation = self.__generation
+
+            try:
+                surface = self.__decode(index)
+            except:
+                # frame can't be decoded (e.g. out of range), the render thread will handle it
+                surface = None
+
+            with self.__condition:
+                # discard the result if the buffer was flushed while decoding
+                if self.__running and generation == self.__generation:
+                    self.__buffer[index] = surface
+                    self.__condition.notify_all()
+
+    def get(self, index: int) -> pygame.Surface | None:
+        with self.__condition:
+            surface = self.__buffer.get(index)
+
+            if surface is not None:
+                self.__hits += 1
+            elif index != self.__last_underrun:
+                # count once for each frame index missed
+                self.__underruns += 1
+                self.__last_underrun = index
+
+            return surface
+
+    def is_ready(self, index: int) -> bool:
+        with self.__condition:
+            return self.__buffer.get(index) is not None
+
+    def drain(self) -> list[tuple[int, pygame.Surface]]:
+        # take all the ready frames then flush the buffer
+        with self.__condition:
+            frames = [(index, surface) for index, surface in self.__buffer.items() if surface is not None]
+
+        self.flush()
+
+        return frames
+
+    def flush(self) -> None:
+        with self.__condition:
+            self.__buffer.clear()
+            self.__generation += 1
+            self.__last_underrun = -1
+            self.__condition.notify_all()
+
+    def start(self) -> None:
+        if self.__running:
+            return
+
+        self.__running = True
+        self.__thread = threading.Thread(target=self.__worker, name='pygvideo-prefetch', daemon=True)
+        self.__thread.start()
+
+    def stop(self) -> None:
+        if not self.__running:
+            return
+
+        with self.__condition:
+            self.__running = False
+            self.__condition.notify_all()
+
+        # wait until the current frame decoding is done
+        if self.__thread is not threading.current_thread():
+            self.__thread.join()
+
+        self.__thread = None
+        self.flush()
+
+    @property
+    def frames(self) -> int:
+        return self.__frames
+
+    @property
+    def total_frame(self) -> int:
+        return len(self.__buffer)
+
+    @property
+    def hits(self) -> int:
+        return self.__hits
+
+    @property
+    def underruns(self) -> int:
+        return self.__underruns
+
+    @property
+    def is_running(self) -> bool:
+        return self.__running
@@ -1,16 +1,60 @@
+import time
 import pygame
 import proglog
 import warnings
+import threading
+import concurrent.futures
 import numpy as np
 from moviepy.video import fx
 from moviepy import (
     ImageSequenceClip,
-    AudioArrayClip,
     VideoFileClip,
-    concatenate_videoclips,
-    concatenate_audioclips
+    concatenate_videoclips
 )
 from ._video_preview import video_preview
+from ._prefetch import FramePrefetcher
+from ._audio import (
+    decode_audio,
+    write_wav,
+    read_wav,
+    fit_samples,
+    submit_audio_job,
+    acquire_audio,
+    release_audio,
+    evict_audio_cache
+)
+from ._reader import (
+    FrameStream,
+    ParallelFrameDecoder,
+    iter_filtered_frames
+)
+from ._cache import FrameCache
+from ._clock import (
+    Clock,
+    MixerClock,
+    PerfCounterClock,
+    CallbackClock
+)
+from ._index import (
+    FrameIndex,
+    load_frame_index
+)
+from ._pool import SurfacePool
+from ._thumbnails import (
+    decode_keyframe,
+    decode_keyframes,
+    get_atlas_rects,
+    make_atlas,
+    load_atlas,
+    save_atlas
+)
+from ._sync import SyncStats
+from ._store import (
+    FrameStore,
+    evict_frame_stores,
+    get_source_key,
+    get_store_size
+)
 from ._utils import (
     PathL as Path,
     GlobalVideo,
@@ -25,6 +69,10 @@ from . import _constants
 
 __all__ = [
     'Video',
+    'Clock',
+    'MixerClock',
+    'PerfCounterClock',
+    'CallbackClock',
     'ignore_warn',
     'enable_warn',
     'get_global_logger',
@@ -47,7 +95,7 @@ class Video:
             filename_or_clip: _utils.Path | _utils.SupportsClip,
             logger: proglog.ProgressBarLogger | typing.Literal['bar', '.global'] | None = '.global',
             load_audio_in_prepare: bool = True,
-            cache: bool = True,
+            cache: _utils.CacheSize = True,
             save_clip_to_global: bool = True,
             **kwargs
 
@@ -63,9 +111,12 @@ class Video:
         `logger`:
             Showing logger/bar. If None, no logger will be shown.
         `load_audio_in_prepare`:
-            load or precisely write the temp audio when prepare is called.
+            load or precisely write the audio file when prepare is called. If False, the audio file is
+            written in the background right away and prepare only waits for it if it isn't done yet.
         `cache`:
-            save frame to cache. (not recommended for videos with large duration and size).
+            save frame to cache. (not recommended for videos with large duration and size). Can be a
+            maximum number of frames as integers or a maximum memory size as strings (e.g. '512MB'), the
+            least recently used frames will be removed when the cache is full.
         `save_clip_to_global`:
             save the VideoClip to global. This is useful for cleaning or closing replaced VideoClips with call
             `quit_all` or `close_all` function.
@@ -85,7 +136,8 @@ class Video:
         Warnings
         --------
         * Don't change the sound of `pygame.mixer.music` because this class uses audio from `pygame.mixer.music`.
-        * Don't delete or replace the audio temp file `__temp__.mp3` because it is the main audio of the video.
+        * Don't delete or replace the audio file of the video (`.get_temp_audio()`) because it is the main audio of
+          the video. The audio of a video file is shared in the cache directory and it's kept after `.quit()`.
         * Don't forget to call the `.prepare()` method to prepare the audio.
         * Don't play 2 videos at the same time.
         * Don't forget to close the video with `.quit()` or `.close()` when not in use or when the system exits.
@@ -132,7 +184,7 @@ class Video:
         self.__filename_or_clip = filename_or_clip
         self.__logger = logger
         self.__load_audio_in_prepare = bool(load_audio_in_prepare)
-        self.__cache = bool(cache)
+        self.__cache = cache
         self.__save_clip_to_global = bool(save_clip_to_global)
         self.__kwargs = kwargs
 
@@ -145,8 +197,27 @@ class Video:
                     stacklevel=2
                 )
 
+        asserter(
+            isinstance(cache, _utils.CacheSize),
+            TypeError(f'cache must be booleans, integers or strings, not {name(cache)}')
+        )
+
+        max_cache_frames = None
+        max_cache_bytes = None
+
+        if isinstance(cache, bool):
+            pass
+        elif isinstance(cache, int):
+            asserter(
+                cache >= 0,
+                ValueError(f'cache cannot be negative values, not {cache}')
+            )
+            max_cache_frames = cache
+        else:
+            max_cache_bytes = _utils.parse_bytes(cache)
+
         # load properties
-        self.__cache_frames = dict()
+        self.__cache_frames = FrameCache(max_cache_frames, max_cache_bytes)
         self.__size = None
         self.__cache_full = False
         self.__quit = False
@@ -155,12 +226,70 @@ class Video:
         self.__pause = False
         self.__mute = False
         self.__index = 0
+        self.__frame_iterator = None
         self.__loops = 0
         self.__video_loops = 0
         self.__frame_index = 0
-        self.__audio_offset = 0
         self.__volume = 0.0
         self.__alpha = 255
+        self.__prefetcher = None
+        self.__audio_future = None
+        # playback clock, the mixer if the video has audio, created in prepare
+        self.__clock: Clock | None = None
+        # clock given by set_clock, used instead of the default clock
+        self.__user_clock: Clock | None = None
+        # a/v drift of the presented frames and the correction policy of draw_and_update
+        self.__sync_stats = SyncStats(_constants.SYNC_STATS_FRAMES)
+        self.__sync_correction = None
+        # the last frame index shown by draw_and_update since the last play or seek
+        self.__presented_index = None
+        # late-frame policy of draw_and_update, it's active from LATE_FRAME_COUNT late frames in a row until
+        # LATE_FRAME_COUNT frames in a row are shown on time again
+        self.__late_policy = None
+        self.__late_active = False
+        self.__late_frames = 0
+        self.__on_time_frames = 0
+        # the next shown frame is read after a new reader, a seek or the late-frame policy, it isn't counted as late
+        self.__late_startup = True
+        # keyframe to decode and the clock time when it was chosen (late-frame policy keyframe)
+        self.__late_keyframe_time = None
+        self.__late_selected_time = None
+        # the frame of the late-frame policy skip is ahead of the clock
+        self.__late_predicted = False
+        # reader in a lower resolution for the late-frame policy resolution
+        self.__late_stream = None
+        self.__late_stream_size = None
+        # the audio is saved in the cache directory and shared if the source file and the audio effects are known
+        self.__shared_audio = False
+        # pcm of the current audio, time edits (cut, loop, concatenate, etc.) are done on this array
+        self.__audio_samples = None
+        self.__audio_fps = _constants.AUDIO_STANDARD_FRAME_RATE
+        self.__stream = None
+        self.__render_stream = None
+        # reusable surfaces (double buffered) for the frames that are not kept and the output of draw_and_update
+        self.__frame_buffers = SurfacePool()
+        self.__output_surfaces = SurfacePool()
+        # the last output of draw_and_update, reused while the clock stays on the same frame
+        self.__last_output = None
+        self.__last_output_key = None
+        self.__last_dest = None
+        self.__last_screen = None
+        self.__dirty_rect = None
+        self.__frame_changed = False
+        self.__source_clip = None
+        self.__decode_at_size = False
+        self.__cache_scaled = False
+        self.__cache_window = None
+        self.__cache_window_index = -1
+        self.__frame_store = None
+        self.__use_frame_store = False
+        self.__keyframe_index = None
+        self.__use_keyframe_index = False
+        # description of the effects applied to the clip, None if the effect can't be described
+        self.__effects: list[str | None] = []
+        # description of the effects applied to the audio of the clip
+        self.__audio_effects: list[str | None] = []
+        self.__decode_lock = threading.RLock()
 
         # initialize moviepy video clip
         if isinstance(filename_or_clip, _utils.SupportsClip):
@@ -170,6 +299,8 @@ class Video:
                 filename=filename_or_clip,
                 **kwargs
             )
+            # the clip without any effects, frames can be read directly from the file
+            self.__source_clip = self.__clip
 
         # save an original clip
         self.__original_clip = self.__clip.copy()
@@ -220,7 +351,21 @@ class Video:
             index = index if index >= 0 else total_frame + index
 
             if 0 <= index < total_frame:
-                return self.get_frame(index * (1 / self.__clip.fps))
+                cache_key = (index, None)
+                frame_surface = self.__cache_frames.get(cache_key)
+
+                if frame_surface is None:
+                    frame_surface = self.__frame_to_surface(self.__read_frame(index), get_original=True)
+                    self.__add_cache(cache_key, frame_surface)
+
+                if self.__size and frame_surface.get_size() != self.__size:
+                    frame_surface = pygame.transform.scale(frame_surface, self.__size)
+                else:
+                    # the cached frame is never given to the caller, so it can't be changed (pixels or alpha)
+                    frame_surface = frame_surface.copy()
+                frame_surface.set_alpha(self.__alpha)
+
+                return frame_surface
             else:
                 # index out of range
                 raise IndexError('frame index out of range')
@@ -236,6 +381,7 @@ class Video:
         self.__video_initialized()
         # reset index every time a new iteration starts
         self.__index = 0
+        self.__close_frame_iterator()
 
         return self
 
@@ -243,14 +389,20 @@ class Video:
         return self
 
     def __next__(self) -> pygame.Surface:
-        # returns the next element, if any
-        if self.__index < self.get_total_frame():
-            result = self[self.__index]
-            self.__index += 1
-            return result
-        else:
+        # returns the next element, if any. The frames are read in chunks from one sequential reader
+        if self.__frame_iterator is None:
+            self.__video_initialized()
+            self.__frame_iterator = self.__iter_frame_surfaces(self.__index)
+
+        try:
+            result = next(self.__frame_iterator)
+        except StopIteration:
             # raises StopIteration when it has run out
-            raise StopIteration
+            self.__frame_iterator = None
+            raise
+
+        self.__index += 1
+        return result
 
     def __exit__(self, *args, **kwargs) -> None:
         # exit (in raise condition or not)
@@ -379,11 +531,21 @@ class Video:
             **self.__kwargs
         )
 
-        video._Video__cache_frames = self.__cache_frames.copy()
-        video._Video__cache_full = self.__cache_full
-
         video.set_size(self.__size)
         video.set_alpha(self.__alpha)
+        video.set_decode_at_size(self.__decode_at_size)
+        video.set_cache_scaled(self.__cache_scaled)
+        video.set_frame_store(self.__use_frame_store)
+        video.set_keyframe_index(self.__use_keyframe_index)
+        video.set_prefetch(self.get_prefetch())
+        video.set_clock(self.__user_clock)
+        video.set_sync_correction(self.__sync_correction)
+        video.set_late_frame_policy(self.__late_policy)
+        if self.__cache_window:
+            video.set_cache_window(*self.__cache_window)
+
+        video._Video__cache_frames = self.__cache_frames.copy()
+        video._Video__cache_full = self.__cache_full
 
         return video
 
@@ -396,19 +558,6 @@ class Video:
             return GLOBALS['logger']
         return self.__logger
 
-    def __fill_audio_with_silent(self, audio: _utils.SupportsAudioClip | None) -> _utils.SupportsAudioClip:
-        audio_duration = audio.duration if audio else 0
-
-        if (duration_diff := (self.__clip.duration - audio_duration)) > 0:
-            fps = _constants.AUDIO_STANDARD_FRAME_RATE
-            silent_audio_array = np.zeros((int(duration_diff * fps), 2))
-            silent_audio = AudioArrayClip(silent_audio_array, fps=fps)
-            if audio:
-                return concatenate_audioclips((audio, silent_audio))
-            return silent_audio
-
-        return audio
-
     def __video_initialized(self) -> None:
         asserter(
             not self.__quit,
@@ -424,41 +573,171 @@ class Video:
     def __load_audio(self, load: typing.Optional[bool] = None, load_file: bool = False) -> None:
 
         def write_audio() -> None:
-            # check if the video has audio, if not, it will be create a silent audio
+            audio = None
+            samples = self.__audio_samples
+            fps = self.__audio_fps
+
             if self.__clip.audio is None:
-                self.__clip.audio = self.__fill_audio_with_silent(None)
+                # the video doesn't have audio, no silent audio is made (see prepare)
+                return
+
+            if samples is None:
+                # add fps attribute to CompositeAudioClip if it doesn't exist
+                if not hasattr(self.__clip.audio, 'fps'):
+                    self.__clip.audio.fps = _constants.AUDIO_STANDARD_FRAME_RATE
 
-            # add fps attribute to CompositeAudioClip if it doesn't exist
-            if not hasattr(self.__clip.audio, 'fps'):
-                self.__clip.audio.fps = _constants.AUDIO_STANDARD_FRAME_RATE
+                audio = self.__clip.audio
+                fps = audio.fps or _constants.AUDIO_STANDARD_FRAME_RATE
 
-            self.__clip.audio.write_audiofile(self.__audio_file, logger=self.__get_logger())
+            audio_file = self.__audio_file
+            shared_audio = self.__shared_audio
+            length = int(self.__clip.duration * fps)
+            logger = self.__get_logger()
+
+            def job() -> tuple[np.ndarray, int]:
+                # decode the audio once to pcm and write it as wav, the mixer doesn't need an encoded file.
+                # the pcm of edited audio is written directly
+                # the audio is padded with silence (or trimmed) to the duration of the video
+                pcm = samples if audio is None else fit_samples(decode_audio(audio, fps, logger=logger), length)
+                write_wav(audio_file, pcm, fps)
+
+                if shared_audio:
+                    evict_audio_cache(_utils.get_cache_dir(), _utils.get_audio_cache_size())
+
+                return (pcm, fps)
+
+            # runs in the background, prepare waits for it if it isn't done yet
+            self.__cancel_audio()
+            self.__audio_future = submit_audio_job(job)
 
         if load_file:
             # create temporary audio file
             path = Path(os.environ.get('PYGAME_VIDEO_TEMP', ''))
-            self.__audio_file = path / '__temp__.mp3'
+            temp_audio_file = path / '__temp__.wav'
             index = 2
 
-            # check whether the audio file name already exists.
+            # check whether the audio file name already exists or is reserved by another video.
             # if it does then it will add an index to create a new temporary audio file name
             global GLOBALS
-            while self.__audio_file.exists() or GLOBALS['video'].is_temp_audio_used(self.__audio_file):
-                self.__audio_file = path / f'__temp_{index}__.mp3'
+            while temp_audio_file.exists() or GLOBALS['video'].is_temp_audio_used(temp_audio_file):
+                temp_audio_file = path / f'__temp_{index}__.wav'
                 index += 1
 
+            self.__temp_audio_file = temp_audio_file
+
+        self.__set_audio_file()
+
+        if self.__shared_audio and self.__audio_file.exists():
+            # the same audio was already written by this video, another video or a previous run
+            return
+
         if isinstance(load, bool) and load:
             write_audio()
 
         elif load is None and not self.__load_audio_in_prepare or self.__ready:
             write_audio()
 
+    def __get_audio_key(self) -> str | None:
+        # the audio can only be shared if the source file and the audio effects are known
+        if self.__source_clip is None or None in self.__audio_effects:
+            return None
+
+        fps = getattr(self.__clip.audio, 'fps', None) or _constants.AUDIO_STANDARD_FRAME_RATE
+
+        return get_source_key(
+            self.__source_clip.filename,
+            'audio',
+            self.__audio_effects,
+            fps,
+            sorted(self.__kwargs.items())
+        )
+
+    def __set_audio_file(self) -> None:
+        if self.__shared_audio:
+            # the cached audio is acquired again if the key doesn't change
+            release_audio(self.__audio_file)
+
+        self.__audio_file = self.__temp_audio_file
+        self.__shared_audio = False
+
+        if (key := self.__get_audio_key()) is None:
+            return
+
+        audio_file = _utils.get_cache_dir() / f'{key}.audio.wav'
+
+        try:
+            audio_file.parent.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            # the cache directory can't be used, use the temporary audio
+            return
+
+        self.__audio_file = audio_file
+        self.__shared_audio = True
+        acquire_audio(audio_file)
+
+    def __wait_audio(self) -> None:
+        # raises the error of the background job if there is any
+        if self.__audio_future is not None:
+            future = self.__audio_future
+            self.__audio_future = None
+            self.__audio_samples, self.__audio_fps = future.result()
+
+    def __get_audio_samples(self) -> np.ndarray | None:
+        # pcm of the current audio from the background job or the written audio file, None if the audio
+        # hasn't been written yet. The error of a failed background job is raised
+        self.__wait_audio()
+
+        if self.__audio_samples is None and self.__audio_file.exists():
+            if (wav := read_wav(self.__audio_file)) is not None:
+                self.__audio_samples, self.__audio_fps = wav
+
+        return self.__audio_samples
+
+    def __reload_audio(self, edit: typing.Callable[[np.ndarray, int], np.ndarray] | None = None) -> None:
+
+        # the clip has been changed. If edit is given, the new audio is made from the pcm of the previous audio
+        # (slicing, tiling, etc.) instead of decoding the audio of the new clip
+        samples = self.__get_audio_samples() if edit else None
+        fps = self.__audio_fps
+
+        self.__unload_audio()
+
+        if samples is not None:
+            self.__audio_samples = fit_samples(edit(samples, fps), int(self.__clip.duration * fps))
+            self.__audio_fps = fps
+
+        self.__load_audio()
+
+    def __set_audio_samples(self, samples: np.ndarray, fps: int) -> None:
+        self.__cancel_audio()
+        self.__audio_samples = fit_samples(samples, int(self.__clip.duration * fps))
+        self.__audio_fps = fps
+        self.__load_audio()
+
+    def __cancel_audio(self) -> None:
+        # the audio is going to be changed, a running job can't be stopped so wait until it's done
+        if self.__audio_future is not None:
+            future = self.__audio_future
+            self.__audio_future = None
+            if not future.cancel():
+                concurrent.futures.wait((future,))
+
     def __unload_audio(self) -> None:
-        if pygame.get_init():
+        self.__cancel_audio()
+
+        # the mixer can't be used after pygame.quit, the other clocks don't use it
+        if pygame.get_init() or not isinstance(self.__clock, MixerClock):
             self.release()
 
+        self.__audio_samples = None
+
+        if self.__shared_audio:
+            # the cached audio is kept for the other videos and the next runs
+            release_audio(self.__audio_file)
+            self.__shared_audio = False
+
         # delete audio temporary file if the file are still there
-        if self.__audio_file.exists():
+        elif self.__audio_file.exists():
             try:
                 os.remove(self.__audio_file)
             except PermissionError:
@@ -472,12 +751,18 @@ class Video:
         self.__play = False
         self.__pause = False
         self.__frame_index = 0
-        self.__audio_offset = 0
+        self.__presented_index = None
+        self.__reset_late_frames()
 
-        pygame.mixer.music.stop()
+        if self.__prefetcher:
+            self.__prefetcher.stop()
+
+        self.__clock.stop()
 
     def __set_effect(self) -> None:
         self.__video_initialized()
+        # a failed background audio job raises here, before the clip is changed
+        self.__wait_audio()
         # stop video to stop the video
         self.__stop()
 
@@ -506,10 +791,441 @@ class Video:
 
         raise TypeError(f"{operator!r} not supported between instances of '{self.__get_mod()}' and '{name(value)}'")
 
-    def __add_cache(self, frame_index: _utils.Number, frame: pygame.Surface) -> None:
+    def __clock_frame_index(self) -> int | None:
+        # called from the prefetch worker thread, peek doesn't change the clock
+        if self.__clock is None or (clock_time := self.__clock.peek()) is None:
+            return None
+
+        return self.__time_to_frame_index(clock_time)
+
+    def __time_to_frame_index(self, time: _utils.SecondsValue) -> int:
+        if keyframe_index := self.__get_keyframe_index():
+            return keyframe_index.get_frame_index(time)
+
+        return int(time * self.__clip.fps)
+
+    def __frame_index_to_time(self, frame_index: int) -> _utils.SecondsValue:
+        if keyframe_index := self.__get_keyframe_index():
+            return keyframe_index.get_time(frame_index)
+
+        return frame_index * (1 / self.__clip.fps)
+
+    def __target_frame_index(self, clock_time: _utils.SecondsValue, drop: bool = False, hold: bool = False) -> int:
+        # the frame index to show at clock_time, used by the sync correction and the late-frame policy
+        frame_index = self.__time_to_frame_index(clock_time)
+
+        if drop and self.__sync_stats.latency > 1 / self.__clip.fps:
+            # getting a frame takes longer than a frame, show the frame that is due when it's ready.
+            # The frames between are dropped
+            frame_index = min(
+                self.__time_to_frame_index(clock_time + self.__sync_stats.latency),
+                self.get_total_frame() - 1
+            )
+
+        if hold and self.__presented_index is not None and frame_index < self.__presented_index:
+            # the clock is behind the shown frame, hold it until the clock reaches it
+            self.__sync_stats.add_held()
+            frame_index = self.__presented_index
+
+        return frame_index
+
+    def __sync_frame_index(self, clock_time: _utils.SecondsValue) -> int:
+        return self.__target_frame_index(
+            clock_time,
+            drop=self.__sync_correction in ('drop', 'both'),
+            hold=self.__sync_correction in ('hold', 'both')
+        )
+
+    def __reset_late_frames(self) -> None:
+        self.__late_active = False
+        self.__late_frames = 0
+        self.__on_time_frames = 0
+        self.__late_startup = True
+
+    def __get_stream_seeks(self) -> int:
+        # a new reader or a seek makes the next frame slow, it's not a sign that the decoding is too slow
+        return sum(stream.seeks for stream in (self.__stream, self.__render_stream, self.__late_stream) if stream)
+
+    def __get_late_mode(self) -> typing.Literal['skip', 'keyframe', 'resolution'] | None:
+        if self.__late_policy is None or not self.__late_active:
+            return None
+
+        # the keyframes and the lower resolution are read from the source file, a clip with effects can only skip
+        if self.__late_policy != 'skip' and self.__clip is not self.__source_clip:
+            return 'skip'
+        if self.__late_policy == 'keyframe' and self.__keyframe_index is None:
+            return 'skip'
+
+        return self.__late_policy
+
+    def __late_frame_index(self, clock_time: _utils.SecondsValue, late_mode: str) -> int:
+        # a frame before the shown frame is never shown while the video is late
+        self.__late_keyframe_time = None
+        self.__late_predicted = False
+
+        match late_mode:
+
+            case 'skip':
+                # the frame that is due when the decoding is done, or the newest frame before it that is
+                # already decoded (cache or prefetch buffer)
+                clock_index = self.__time_to_frame_index(clock_time)
+                frame_index = self.__target_frame_index(clock_time, drop=True, hold=True)
+
+                for index in range(frame_index, max(clock_index, self.__presented_index or 0) - 1, -1):
+                    if self.__cache_key(index) in self.__cache_frames or (self.__prefetcher and
+                                                                         self.__prefetcher.is_ready(index)):
+                        frame_index = index
+                        break
+
+                self.__late_predicted = frame_index > clock_index
+                return frame_index
+
+            case 'keyframe':
+                # the last keyframe before the clock, the shown frame is held until the next keyframe
+                keyframe_index = self.__keyframe_index
+                keyframe_time = keyframe_index.get_time(
+                    keyframe_index.get_keyframe(keyframe_index.get_frame_index(clock_time))
+                )
+                frame_index = self.__time_to_frame_index(keyframe_time + 0.0005)
+
+                if self.__presented_index is not None and frame_index <= self.__presented_index:
+                    return self.__presented_index
+
+                self.__late_keyframe_time = keyframe_time
+                self.__late_selected_time = clock_time
+                return frame_index
+
+        return self.__target_frame_index(clock_time, hold=True)
+
+    def __decode_late_frame(self, frame_index: int, late_mode: str) -> pygame.Surface:
+        # the frame is only shown while the video is late, it's not saved to the cache
+        with self.__decode_lock:
+            width, height = self.__size if self.__is_decoding_at_size() else (self.__clip.w, self.__clip.h)
+
+            if late_mode == 'keyframe':
+                # decode the keyframe alone, the frames before it are not decoded
+                frame = decode_keyframe(self.__clip.filename, self.__late_keyframe_time, (width, height))
+
+            else:
+                size = (max(int(width * _constants.LATE_FRAME_SCALE), 1), max(int(height * _constants.LATE_FRAME_SCALE), 1))
+
+                if self.__late_stream is None or self.__late_stream_size != size:
+                    if self.__late_stream:
+                        self.__late_stream.close()
+                    self.__late_stream = self.__new_stream(size)
+                    self.__late_stream_size = size
+
+                frame = self.__late_stream.read(frame_index)
+
+        if frame is None:
+            return self.__decode_frame(frame_index)
+
+        return self.__frame_to_surface(frame, get_original=True)
+
+    def __present_frame(self, frame_index: int, late_mode: str | None = None, startup: bool = False) -> None:
+        # record the drift of the shown frame, the clock time now minus the time of the frame
+        if (clock_time := self.__clock.get_time()) is not None:
+            self.__sync_stats.add_drift(clock_time - self.__frame_index_to_time(frame_index))
+
+            if late_mode == 'keyframe' and self.__late_keyframe_time is not None:
+                # the keyframe is decoded by a new reader, the video is late if the keyframe was already
+                # late when it was chosen
+                clock_time = self.__late_selected_time
+
+            if not (startup or self.__late_startup):
+                self.__count_late_frame(clock_time - self.__frame_index_to_time(frame_index), late_mode)
+
+        if self.__presented_index is not None and frame_index > self.__presented_index + 1:
+            self.__sync_stats.add_dropped(frame_index - self.__presented_index - 1)
+
+        self.__presented_index = frame_index
+        self.__late_startup = False
+
+    def __count_late_frame(self, drift: _utils.SecondsValue, late_mode: str | None) -> None:
+        if drift > 1 / self.__clip.fps:
+            # the next frame was already due when the frame is shown
+            self.__sync_stats.add_late()
+            self.__late_frames += 1
+            self.__on_time_frames = 0
+
+            if self.__late_frames >= _constants.LATE_FRAME_COUNT:
+                self.__late_active = True
+
+        # a frame of skip ahead of the clock doesn't mean the frame at the clock can be shown on time
+        elif not (late_mode == 'skip' and self.__late_predicted):
+            self.__late_frames = 0
+            self.__on_time_frames += 1
+
+            # the decoding can continue from a keyframe that is on time, the next keyframe can be seconds away
+            if self.__late_active and (late_mode == 'keyframe' or self.__on_time_frames >= _constants.LATE_FRAME_COUNT):
+                self.__late_active = False
+                # the reader of the full quality frames continues from its old position
+                self.__late_startup = True
+
+    def __reader_kwargs(self, size: tuple[int, int] | None = None) -> dict:
+        reader = self.__clip.reader
+        return dict(
+            pixel_format=reader.pixel_format,
+            target_resolution=size or reader.size,
+            resize_algo=reader.resize_algo,
+            fps_source=self.__kwargs.get('fps_source', 'fps')
+        )
+
+    def __new_stream(self, size: tuple[int, int] | None = None) -> FrameStream:
+        if self.__clip is self.__source_clip:
+            return FrameStream(
+                clip=self.__clip,
+                filename=self.__clip.filename,
+                reader_kwargs=self.__reader_kwargs(size),
+                index=self.__get_keyframe_index()
+            )
+
+        # clip with effects, the frames can only be read from the clip
+        return FrameStream(self.__clip)
+
+    def __get_stream(self) -> FrameStream:
+        if self.__stream is None:
+            self.__stream = self.__new_stream()
+
+        return self.__stream
+
+    def __is_decoding_at_size(self) -> bool:
+        # the size can only be pushed down into the reader if the clip doesn't have any effects
+        return bool(self.__decode_at_size and self.__size and self.__clip is self.__source_clip)
+
+    def __get_render_stream(self) -> FrameStream | None:
+        # the frames of the clip are timed by the frame rate, the keyframe index needs its own reader too
+        if not (self.__is_decoding_at_size() or self.__get_keyframe_index()):
+            return None
+
+        if self.__render_stream is None:
+            self.__render_stream = self.__new_stream(self.__size if self.__is_decoding_at_size() else None)
+
+        return self.__render_stream
+
+    def __get_keyframe_index(self) -> FrameIndex | None:
+        # the index describes the source file, it can't be used if the clip has effects
+        if not self.__use_keyframe_index or self.__clip is not self.__source_clip:
+            return None
+
+        return self.__keyframe_index
+
+    def __close_streams(self) -> None:
+        with self.__decode_lock:
+            if self.__stream:
+                self.__stream.close()
+                self.__stream = None
+
+            if self.__render_stream:
+                self.__render_stream.close()
+                self.__render_stream = None
+
+            if self.__late_stream:
+                self.__late_stream.close()
+                self.__late_stream = None
+
+        self.__frame_buffers.clear()
+        self.__output_surfaces.clear()
+        self.__last_output = None
+        self.__last_output_key = None
+
+    def __reset_render_stream(self) -> None:
+        if not self.__decode_at_size:
+            return
+
+        # the reader will be rebuilt lazily in the new size at the current frame index
+        with self.__decode_lock:
+            if self.__render_stream:
+                self.__render_stream.close()
+                self.__render_stream = None
+
+        # frames in the cache and the prefetch buffer were decoded in the old size
+        if self.__prefetcher:
+            self.__prefetcher.flush()
+        self.clear_cache_frame()
+
+    def __get_frame_store(self) -> FrameStore | None:
+        # the frame store can only be used if the source file and the effects are known
+        if not self.__use_frame_store or self.__source_clip is None or None in self.__effects:
+            return None
+
+        if self.__frame_store is None:
+            shape = (self.get_total_frame(), self.__clip.h, self.__clip.w)
+            # the frames are read by their presentation time instead of the frame rate with the keyframe index
+            identity = ('keyframe-index',) if self.__get_keyframe_index() else ()
+            # the VideoFileClip kwargs (resize_algorithm, pixel_format, etc.) change the decoded frames too
+            key = get_source_key(
+                self.__source_clip.filename,
+                self.__effects,
+                shape,
+                self.__clip.fps,
+                sorted(self.__kwargs.items()),
+                *identity
+            )
+            if key is None:
+                return None
+
+            store_size = get_store_size(shape)
+            max_store_size = _utils.get_frame_store_size()
+
+            if store_size > max_store_size:
+                # the store alone doesn't fit, the frames are decoded without the store
+                warnings.warn(
+                    f'From {self.__get_mod()}.set_frame_store: '
+                    f'The frame store needs {store_size} bytes, which is more than the {max_store_size} bytes '
+                    'allowed by PYGAME_VIDEO_FRAME_STORE_SIZE. The frame store is disabled.',
+                    category=UserWarning,
+                    stacklevel=3
+                )
+                self.__use_frame_store = False
+                return None
+
+            # make room for the new store by removing the least recently used stores
+            evict_frame_stores(_utils.get_cache_dir(), max_store_size - store_size, key)
+            self.__frame_store = FrameStore(_utils.get_cache_dir(), key, shape)
+
+        return self.__frame_store
+
+    def __close_frame_store(self) -> None:
+        with self.__decode_lock:
+            if self.__frame_store:
+                self.__frame_store.close()
+                self.__frame_store = None
+
+    def __read_frame(self, frame_index: int) -> np.ndarray:
+        # sequential read (by frame index), used for iterating over the frames
+        with self.__decode_lock:
+            frame_store = self.__get_frame_store()
+
+            if frame_store and frame_index in frame_store:
+                return frame_store.get(frame_index)
+
+            frame = self.__get_stream().read(frame_index)
+
+            if frame_store:
+                frame_store.add(frame_index, frame)
+
+            return frame
+
+    def __decode_frame(self, frame_index: int, reuse: bool = False) -> pygame.Surface:
+        # decode a frame for rendering, the frame is already in the target size if decode at size is active.
+        # if reuse is True, the returned surface is overwritten by the next decoded frame
+        with self.__decode_lock:
+            render_stream = self.__get_render_stream()
+            frame_store = None if self.__is_decoding_at_size() else self.__get_frame_store()
+
+            if frame_store and frame_index in frame_store:
+                if reuse:
+                    # copy the frame from the memory map into a frame buffer instead of allocating a new frame
+                    frame_buffer, frame_surface = self.__frame_buffers.get_buffer((self.__clip.w, self.__clip.h))
+                    frame_store.get(frame_index, frame_buffer)
+                    return frame_surface
+
+                return self.__frame_to_surface(frame_store.get(frame_index), get_original=True, copy=False)
+
+            if reuse and not frame_store:
+                if render_stream:
+                    size = self.__size if self.__is_decoding_at_size() else (self.__clip.w, self.__clip.h)
+                    return self.__read_into_buffer(render_stream, size, frame_index)
+                elif self.__clip is self.__source_clip:
+                    return self.__read_into_buffer(self.__get_stream(), (self.__clip.w, self.__clip.h), frame_index)
+
+            if render_stream:
+                frame = render_stream.read(frame_index)
+            else:
+                frame = self.__clip.get_frame(frame_index * (1 / self.__clip.fps))
+
+                if frame_store:
+                    frame_store.add(frame_index, frame)
+
+        if reuse:
+            # copy the frame into a frame buffer instead of allocating a new frame
+            frame_buffer, frame_surface = self.__frame_buffers.get_buffer((frame.shape[1], frame.shape[0]))
+            np.copyto(frame_buffer, frame[:, :, :3], casting='unsafe')
+            return frame_surface
+
+        return self.__frame_to_surface(frame, get_original=True)
+
+    def __read_into_buffer(self, stream: FrameStream, size: tuple[int, int], frame_index: int) -> pygame.Surface:
+        frame_buffer, frame_surface = self.__frame_buffers.get_buffer(size)
+
+        # the frame is decoded straight into the memory of the surface
+        stream.read_into(frame_index, frame_buffer)
+
+        return frame_surface
+
+    def __resize_frame(self, frame: np.ndarray, size: tuple[int, int]) -> np.ndarray:
+        # the surface is only read by transform.scale
+        frame_surface = pygame.transform.scale(self.__frame_to_surface(frame, get_original=True, copy=False), size)
+        return np.transpose(pygame.surfarray.array3d(frame_surface), (1, 0, 2))
+
+    def __frame_to_surface(self, frame: np.ndarray, get_original: bool = False, copy: bool = True) -> pygame.Surface:
+        # the surface shares the memory of the frame and frombuffer ignores the read-only flag, so the frame is copied
+        # unless it's a new array owned by the surface (copy=False). The frames of the reader (bytes) and of the clip
+        # (e.g. the frame list of ImageSequenceClip) must never be written through a surface given to the caller
+        if copy:
+            frame = np.array(frame[:, :, :3], dtype=np.uint8)
+        else:
+            frame = np.ascontiguousarray(frame[:, :, :3], dtype=np.uint8)
+        frame_surface = pygame.image.frombuffer(frame, (frame.shape[1], frame.shape[0]), 'RGB')
+
+        if not get_original:
+            if self.__size and frame_surface.get_size() != self.__size:
+                frame_surface = pygame.transform.scale(frame_surface, self.__size)
+            frame_surface.set_alpha(self.__alpha)
+
+        return frame_surface
+
+    def __cache_key(self, frame_index: int) -> tuple[int, tuple[int, int] | None]:
+        # raw frames are saved with size None, display-ready frames are saved with their size
+        return (frame_index, self.__size if self.__cache_scaled else None)
+
+    def __display_ready(self, frame_surface: pygame.Surface) -> pygame.Surface:
+        if self.__size and frame_surface.get_size() != self.__size:
+            frame_surface = pygame.transform.scale(frame_surface, self.__size)
+
+        # convert to the display pixel format so blitting doesn't need to convert it every time
+        if pygame.display.get_surface():
+            frame_surface = frame_surface.convert()
+
+        return frame_surface
+
+    def __remove_cache_size(self, size: tuple[int, int] | None) -> None:
+        for key in [key for key in self.__cache_frames if key[1] == size]:
+            self.__cache_frames.remove(key)
+
+        self.__cache_full = False
+
+    def __cache_decoded(self, frame_index: int, frame_surface: pygame.Surface) -> pygame.Surface:
+        if not self.__cache or self.__cache_full:
+            # the frame isn't saved, draw_and_update scales it into the output surfaces
+            return frame_surface
+
+        if self.__cache_scaled:
+            frame_surface = self.__display_ready(frame_surface)
+
+        self.__add_cache(self.__cache_key(frame_index), frame_surface)
+
+        return frame_surface
+
+    def __trim_cache_window(self) -> None:
+        if not self.__cache_window or self.__frame_index == self.__cache_window_index:
+            return
+
+        behind, ahead = self.__cache_window
+        fps = self.__clip.fps
+
+        # remove the frames that fall out of the window around the playhead
+        self.__cache_frames.trim(
+            self.__frame_index - int(behind * fps),
+            self.__frame_index + int(ahead * fps) + 1
+        )
+        self.__cache_window_index = self.__frame_index
+
+    def __add_cache(self, key: tuple[int, tuple[int, int] | None], frame: pygame.Surface, pin: bool = False) -> None:
         if not self.__cache_full and self.__cache:
             try:
-                self.__cache_frames[frame_index] = frame
+                self.__cache_frames.add(key, frame, pin)
             except MemoryError:
                 self.__cache_full = True
 
@@ -566,6 +1282,47 @@ class Video:
         self.__video_initialized()
         return len(self.__cache_frames)
 
+    def get_cache_stats(self) -> dict[str, int | None]:
+        self.__video_initialized()
+        return self.__cache_frames.get_stats()
+
+    def get_sync_stats(self) -> dict[str, int | float | None]:
+        self.__video_initialized()
+        return self.__sync_stats.get_stats()
+
+    def get_sync_correction(self) -> typing.Literal['drop', 'hold', 'both'] | None:
+        self.__video_initialized()
+        return self.__sync_correction
+
+    def get_late_frame_policy(self) -> typing.Literal['skip', 'keyframe', 'resolution'] | None:
+        self.__video_initialized()
+        return self.__late_policy
+
+    def get_cache_window(self) -> tuple[_utils.SecondsValue, _utils.SecondsValue] | None:
+        self.__video_initialized()
+        return self.__cache_window
+
+    def get_dirty_rect(self) -> pygame.Rect | None:
+        self.__video_initialized()
+        return self.__dirty_rect
+
+    def get_keyframes(self) -> list[_utils.MilisecondsValue]:
+        self.__video_initialized()
+        if keyframe_index := self.__get_keyframe_index():
+            return [keyframe_index.get_time(keyframe) * 1000 for keyframe in keyframe_index.keyframes]
+        return []
+
+    def get_frame_store_file(self) -> Path | None:
+        self.__video_initialized()
+        if frame_store := self.__get_frame_store():
+            return frame_store.data_file
+
+    def get_total_store_frame(self) -> int:
+        self.__video_initialized()
+        if frame_store := self.__get_frame_store():
+            return frame_store.total_frame
+        return 0
+
     def get_original_size(self) -> tuple[int, int]:
         self.__video_initialized()
         return (self.__original_clip.w, self.__original_clip.h)
@@ -640,106 +1397,638 @@ class Video:
             return -2
         elif not self.__play:
             return -1
-        elif self.is_play:
-            return self.__audio_offset + pygame.mixer.music.get_pos()
+        elif self.is_play and (clock_time := self.__clock.get_time()) is not None:
+            return clock_time * 1000
+
+        return self.get_duration()
+
+    def get_alpha(self) -> int:
+        self.__video_initialized()
+        return self.__alpha
+
+    def get_duration(self) -> _utils.MilisecondsValue:
+        self.__video_initialized()
+        return self.__clip.duration * 1000
+
+    def get_start(self) -> _utils.MilisecondsValue:
+        self.__video_initialized()
+        return self.__clip.start * 1000
+
+    def get_end(self) -> _utils.MilisecondsValue | None:
+        self.__video_initialized()
+        if self.__clip.end:
+            return self.__clip.end * 1000
+
+    def get_total_frame(self) -> int:
+        self.__video_initialized()
+        if keyframe_index := self.__get_keyframe_index():
+            # exact number of frames in the file
+            return keyframe_index.total_frame
+        return int(self.__clip.duration * self.__clip.fps)
+
+    def get_fps(self) -> _utils.Number:
+        self.__video_initialized()
+        return self.__clip.fps
+
+    def get_volume(self) -> float:
+        self.__video_initialized()
+        self.__audio_loaded()
+        if self.__mute:
+            return self.__volume
+        else:
+            return pygame.mixer.music.get_volume()
+
+    def get_frame_index(self) -> int:
+        self.__video_initialized()
+        return self.__frame_index
+
+    def get_prefetch(self) -> int:
+        self.__video_initialized()
+        if self.__prefetcher:
+            return self.__prefetcher.frames
+        return 0
+
+    def get_total_prefetch_frame(self) -> int:
+        self.__video_initialized()
+        if self.__prefetcher:
+            return self.__prefetcher.total_frame
+        return 0
+
+    def get_prefetch_underruns(self) -> int:
+        self.__video_initialized()
+        if self.__prefetcher:
+            return self.__prefetcher.underruns
+        return 0
+
+    def get_clock(self) -> Clock | None:
+        self.__video_initialized()
+        # the clock that times the video, before prepare it's the clock given by set_clock
+        if self.__ready:
+            return self.__clock
+        return self.__user_clock
+
+    def get_frame(self, index_time: _utils.Number, get_original: bool = False) -> pygame.Surface:
+        self.__video_initialized()
+
+        # the prefetch worker thread can read the clip at the same time
+        with self.__decode_lock:
+            frame = self.__clip.get_frame(index_time)
+
+        # the frame of the reader is shared (and read-only), the surface of the caller gets its own copy
+        return self.__frame_to_surface(frame, get_original)
+
+    def get_frame_array(self, index_time: _utils.Number, get_original: bool = False) -> np.ndarray:
+        self.__video_initialized()
+
+        with self.__decode_lock:
+            frame = self.__clip.get_frame(index_time)
+
+        if get_original or not self.__size or (frame.shape[1], frame.shape[0]) == self.__size:
+            # no surface is created, the frame is copied because the reader keeps it as the last read frame
+            return np.array(frame)
+
+        return self.__resize_frame(frame, self.__size)
+
+    def get_frames(self,
+                   indices: typing.Optional[typing.Iterable[int]] = None,
+                   times: typing.Optional[typing.Iterable[_utils.SecondsValue]] = None,
+                   size: typing.Optional[tuple[int, int]] = None,
+                   out: typing.Optional[np.ndarray] = None) -> np.ndarray:
+
+        self.__video_initialized()
+        asserter(
+            (indices is None) != (times is None),
+            TypeError('get_frames requires either indices or times')
+        )
+
+        if times is not None:
+            # 1e-5 so that the time of a frame (index / fps) doesn't fall into the previous frame
+            indices = [self.__time_to_frame_index(time + 1e-5) for time in times]
+
+        indices = np.asarray(indices if isinstance(indices, np.ndarray) else list(indices))
+        total_frame = self.get_total_frame()
+
+        asserter(
+            indices.ndim == 1 and (indices.size == 0 or indices.dtype.kind in 'iu'),
+            TypeError(f'indices must be a sequence of integers, not {indices.dtype}')
+        )
+
+        indices = np.where(indices < 0, indices + total_frame, indices)
+
+        asserter(
+            ((0 <= indices) & (indices < total_frame)).all(),
+            IndexError('frame index out of range')
+        )
+
+        width, height = size or (self.__clip.w, self.__clip.h)
+        shape = (len(indices), height, width, 3)
+
+        if out is None:
+            out = np.empty(shape, dtype=np.uint8)
+        else:
+            asserter(
+                isinstance(out, np.ndarray) and out.shape == shape and out.dtype == np.uint8,
+                ValueError(f'out must be an uint8 array with shape {shape}, not {getattr(out, "shape", name(out))}')
+            )
+
+        resize = (width, height) != (self.__clip.w, self.__clip.h)
+        stream = None
+
+        with self.__decode_lock:
+            if resize and self.__clip is self.__source_clip:
+                # ffmpeg decodes the frames in the requested size
+                stream = self.__new_stream((width, height))
+                resize = False
+
+            try:
+                previous_index = previous_row = None
+
+                # sorted by frame index, so the frames are decoded in a single forward pass
+                for row in np.argsort(indices, kind='stable'):
+                    frame_index = int(indices[row])
+
+                    if frame_index == previous_index:
+                        out[row] = out[previous_row]
+                    elif stream:
+                        stream.read_into(frame_index, out[row])
+                    elif resize:
+                        out[row] = self.__resize_frame(self.__read_frame(frame_index), (width, height))
+                    else:
+                        out[row] = self.__read_frame(frame_index)
+
+                    previous_index, previous_row = frame_index, row
+
+            finally:
+                if stream:
+                    stream.close()
+
+        return out
+
+    def iter_frames(self,
+                    step: typing.Optional[int] = None,
+                    fps: typing.Optional[_utils.Number] = None,
+                    size: typing.Optional[tuple[int, int]] = None,
+                    as_: typing.Literal['surface', 'ndarray'] = 'surface') -> typing.Generator[pygame.Surface | np.ndarray, None, None]:
+
+        self.__video_initialized()
+        asserter(
+            step is None or fps is None,
+            TypeError('iter_frames takes either step or fps, not both')
+        )
+        asserter(
+            isinstance(step, int | None),
+            TypeError(f'step must be integers or None, not {name(step)}')
+        )
+        asserter(
+            isinstance(fps, _utils.Number | None),
+            TypeError(f'fps must be integers, floats or None, not {name(fps)}')
+        )
+        asserter(
+            (step is None or step > 0) and (fps is None or fps > 0),
+            ValueError('step and fps must be greater than 0')
+        )
+        asserter(
+            as_ in ('surface', 'ndarray'),
+            ValueError(f"as_ must be 'surface' or 'ndarray', not {as_!r}")
+        )
+
+        width, height = size or (self.__clip.w, self.__clip.h)
+
+        if self.__clip is self.__source_clip:
+            if fps is not None:
+                # round up, so every sample is the frame displayed at that time (same as get_frames)
+                filters = [f'fps={fps}:round=up']
+            elif step is not None and step > 1:
+                # the escaped comma is part of the expression, not a filter separator
+                filters = [f'select=not(mod(n\\,{step}))']
+            else:
+                filters = []
+
+            frames = iter_filtered_frames(
+                filename=self.__clip.filename,
+                size=(width, height),
+                filters=filters,
+                resize_algo=self.__clip.reader.resize_algo
+            )
+
+        else:
+            # clip with effects, only the selected frames are read from the clip
+            frames = self.__iter_selected_frames(step, fps, (width, height))
+
+        try:
+            for frame in frames:
+                if as_ == 'surface':
+                    yield pygame.image.frombuffer(frame, (width, height), 'RGB')
+                else:
+                    yield frame
+        finally:
+            frames.close()
+
+    def __iter_selected_frames(self,
+                               step: int | None,
+                               fps: _utils.Number | None,
+                               size: tuple[int, int]) -> typing.Generator[np.ndarray, None, None]:
+
+        if fps is not None:
+            indices = (self.__time_to_frame_index(time + 1e-5) for time in np.arange(0, self.__clip.duration, 1 / fps))
+        else:
+            indices = range(0, self.get_total_frame(), step or 1)
+
+        for frame_index in indices:
+            frame = self.__read_frame(frame_index)
+
+            if (frame.shape[1], frame.shape[0]) != size:
+                frame = self.__resize_frame(frame, size)
+
+            # copied, the frame can be the last read frame of the reader or a view of the frame store
+            yield np.array(frame[:, :, :3], dtype=np.uint8)
+
+    def iter_chunks(self,
+                    chunk_frames: int = 64,
+                    size: typing.Optional[tuple[int, int]] = None,
+                    as_: typing.Literal['ndarray', 'surface'] = 'ndarray') -> typing.Generator[np.ndarray | list[pygame.Surface], None, None]:
+
+        self.__video_initialized()
+        asserter(
+            isinstance(chunk_frames, int),
+            TypeError(f'chunk_frames must be integers, not {name(chunk_frames)}')
+        )
+        asserter(
+            chunk_frames > 0,
+            ValueError(f'chunk_frames must be greater than 0, not {chunk_frames}')
+        )
+        asserter(
+            as_ in ('surface', 'ndarray'),
+            ValueError(f"as_ must be 'surface' or 'ndarray', not {as_!r}")
+        )
+
+        width, height = size or (self.__clip.w, self.__clip.h)
+        # surfaces that wrap the rows of each chunk buffer, made once for each buffer
+        surfaces = {}
+        chunks = self.__iter_chunk_arrays(chunk_frames, (width, height), reuse=True)
+
+        try:
+            for chunk in chunks:
+                if as_ == 'ndarray':
+                    yield chunk
+                    continue
+
+                buffer = chunk.base
+                if id(buffer) not in surfaces:
+                    surfaces[id(buffer)] = [pygame.image.frombuffer(frame, (width, height), 'RGB') for frame in buffer]
+
+                yield surfaces[id(buffer)][:len(chunk)]
+        finally:
+            chunks.close()
+
+    def __iter_chunk_arrays(self,
+                            chunk_frames: int,
+                            size: tuple[int, int],
+                            reuse: bool,
+                            start: int = 0) -> typing.Generator[np.ndarray, None, None]:
+
+        # blocks of (frames, height, width, 3) in order. If reuse is True, two chunk buffers are used in turn,
+        # so a chunk is overwritten by the chunk after the next one
+        width, height = size
+        total_frame = self.get_total_frame()
+        buffers = []
+
+        if self.__clip is self.__source_clip:
+            # own reader in the requested size, the cursor is not moved by the other readers
+            stream = self.__new_stream(size)
+            resize = False
+        else:
+            stream = FrameStream(self.__clip)
+            resize = size != (self.__clip.w, self.__clip.h)
+
+        try:
+            for chunk_index, chunk_start in enumerate(range(start, total_frame, chunk_frames)):
+                if reuse and len(buffers) == 2:
+                    buffer = buffers[chunk_index % 2]
+                else:
+                    buffer = np.empty((chunk_frames, height, width, 3), dtype=np.uint8)
+                    if reuse:
+                        buffers.append(buffer)
+
+                chunk = buffer[:min(chunk_frames, total_frame - chunk_start)]
+
+                if stream.is_sequential:
+                    for row, frame in enumerate(chunk):
+                        stream.read_into(chunk_start + row, frame)
+                else:
+                    # the clip reader is shared with the other methods
+                    with self.__decode_lock:
+                        for row, frame in enumerate(chunk):
+                            decoded = stream.read(chunk_start + row)
+                            frame[...] = self.__resize_frame(decoded, size) if resize else decoded[:, :, :3]
+
+                yield chunk
+        finally:
+            stream.close()
+
+    def __iter_frame_surfaces(self, start: int) -> typing.Generator[pygame.Surface, None, None]:
+        # the chunk buffers are not reused, the surfaces can be kept after the iteration
+        size = self.__size or (self.__clip.w, self.__clip.h)
+        chunks = self.__iter_chunk_arrays(64, size, reuse=False, start=start)
+
+        try:
+            for chunk in chunks:
+                for frame in chunk:
+                    frame_surface = pygame.image.frombuffer(frame, size, 'RGB')
+                    frame_surface.set_alpha(self.__alpha)
+                    yield frame_surface
+        finally:
+            chunks.close()
+
+    def __close_frame_iterator(self) -> None:
+        if self.__frame_iterator is not None:
+            self.__frame_iterator.close()
+            self.__frame_iterator = None
+
+    def thumbnails(self,
+                   count: int,
+                   size: tuple[int, int] | list[int] = (160, 90),
+                   columns: typing.Optional[int] = None,
+                   as_: typing.Literal['surface', 'ndarray'] = 'surface',
+                   workers: typing.Optional[int] = None,
+                   store: bool = True) -> tuple[pygame.Surface | np.ndarray, dict[_utils.MilisecondsValue, pygame.Rect]]:
+
+        asserter(
+            isinstance(count, int),
+            TypeError(f'count must be integers, not {name(count)}')
+        )
+        asserter(
+            count > 0,
+            ValueError(f'count must be greater than 0, not {count}')
+        )
+        asserter(
+            isinstance(columns, int | None),
+            TypeError(f'columns must be integers or None, not {name(columns)}')
+        )
+
+        # square grid by default
+        return self.__make_atlas(count, size, columns or int(np.ceil(np.sqrt(count))), 0, (0, 0, 0), as_, workers, store)
+
+    def contact_sheet(self,
+                      columns: int = 4,
+                      rows: int = 4,
+                      size: tuple[int, int] | list[int] = (160, 90),
+                      padding: int = 4,
+                      color: _utils.ColorValue = 'black',
+                      as_: typing.Literal['surface', 'ndarray'] = 'surface',
+                      workers: typing.Optional[int] = None,
+                      store: bool = True) -> tuple[pygame.Surface | np.ndarray, dict[_utils.MilisecondsValue, pygame.Rect]]:
+
+        asserter(
+            isinstance(columns, int) and isinstance(rows, int),
+            TypeError(f'columns and rows must be integers, not {name(columns)} and {name(rows)}')
+        )
+        asserter(
+            columns > 0 and rows > 0,
+            ValueError(f'columns and rows must be greater than 0, not {columns} and {rows}')
+        )
+        asserter(
+            isinstance(padding, int),
+            TypeError(f'padding must be integers, not {name(padding)}')
+        )
+        asserter(
+            padding >= 0,
+            ValueError(f'padding cannot be negative values, not {padding}')
+        )
 
-        return self.get_duration()
+        return self.__make_atlas(columns * rows, size, columns, padding, tuple(pygame.Color(color))[:3], as_, workers, store)
 
-    def get_alpha(self) -> int:
-        self.__video_initialized()
-        return self.__alpha
+    def __make_atlas(self,
+                     count: int,
+                     size: tuple[int, int] | list[int],
+                     columns: int,
+                     padding: int,
+                     color: tuple[int, int, int],
+                     as_: typing.Literal['surface', 'ndarray'],
+                     workers: int | None,
+                     store: bool) -> tuple[pygame.Surface | np.ndarray, dict[_utils.MilisecondsValue, pygame.Rect]]:
 
-    def get_duration(self) -> _utils.MilisecondsValue:
         self.__video_initialized()
-        return self.__clip.duration * 1000
+        asserter(
+            isinstance(size, tuple | list),
+            TypeError(f'size must be tuples or lists, not {name(size)}')
+        )
+        asserter(
+            len(size) == 2,
+            ValueError(f'size must contain 2 values, not {len(size)}')
+        )
+        asserter(
+            columns > 0,
+            ValueError(f'columns must be greater than 0, not {columns}')
+        )
+        asserter(
+            isinstance(workers, int | None),
+            TypeError(f'workers must be integers or None, not {name(workers)}')
+        )
+        asserter(
+            workers is None or workers > 0,
+            ValueError(f'workers must be greater than 0, not {workers}')
+        )
+        asserter(
+            as_ in ('surface', 'ndarray'),
+            ValueError(f"as_ must be 'surface' or 'ndarray', not {as_!r}")
+        )
 
-    def get_start(self) -> _utils.MilisecondsValue:
-        self.__video_initialized()
-        return self.__clip.start * 1000
+        size = tuple(map(int, size))
+        file = None
 
-    def get_end(self) -> _utils.MilisecondsValue | None:
-        self.__video_initialized()
-        if self.__clip.end:
-            return self.__clip.end * 1000
+        if store and self.__clip is self.__source_clip:
+            # saved next to the frame store, the atlas only depends on the source file and the layout
+            key = get_source_key(self.__clip.filename, 'thumbnails', count, size, columns, padding, color)
+            if key is not None:
+                file = _utils.get_cache_dir() / f'{key}.thumbs.npz'
 
-    def get_total_frame(self) -> int:
-        self.__video_initialized()
-        return int(self.__clip.duration * self.__clip.fps)
+        if file and (saved := load_atlas(file)):
+            atlas, times, rects = saved
+        else:
+            # the time of each tile is the middle of its part of the video
+            times = (np.arange(count) + 0.5) * (self.__clip.duration / count) * 1000
+            rects = np.asarray(get_atlas_rects(count, size, columns, padding))
+            atlas = make_atlas(self.__decode_thumbnails(times / 1000, size, workers), size, columns, padding, color)
 
-    def get_fps(self) -> _utils.Number:
-        self.__video_initialized()
-        return self.__clip.fps
+            if file:
+                save_atlas(file, atlas, times, rects)
 
-    def get_volume(self) -> float:
-        self.__video_initialized()
-        self.__audio_loaded()
-        if self.__mute:
-            return self.__volume
-        else:
-            return pygame.mixer.music.get_volume()
+        tile_map = {float(time): pygame.Rect(*map(int, rect)) for time, rect in zip(times, rects)}
 
-    def get_frame_index(self) -> int:
-        self.__video_initialized()
-        return self.__frame_index
+        if as_ == 'surface':
+            return (pygame.image.frombuffer(atlas, (atlas.shape[1], atlas.shape[0]), 'RGB'), tile_map)
 
-    def get_frame(self, index_time: _utils.Number, get_original: bool = False) -> pygame.Surface:
-        self.__video_initialized()
-        frame = self.__clip.get_frame(index_time)
-        frame_surface = pygame.surfarray.make_surface(frame.swapaxes(0, 1))
+        return (atlas, tile_map)
 
-        if not get_original:
-            if self.__size:
-                frame_surface = pygame.transform.scale(frame_surface, self.__size)
-            frame_surface.set_alpha(self.__alpha)
+    def __decode_thumbnails(self,
+                            times: np.ndarray,
+                            size: tuple[int, int],
+                            workers: int | None) -> list[np.ndarray | None]:
 
-        return frame_surface
+        if self.__clip is self.__source_clip:
+            try:
+                keyframe_index = self.__keyframe_index or load_frame_index(self.__clip.filename, _utils.get_cache_dir())
+            except OSError:
+                keyframe_index = None
+
+            if keyframe_index is not None:
+                # the nearest keyframe of each time, a keyframe shared by several tiles is decoded once
+                keyframe_times = keyframe_index.times[keyframe_index.keyframes]
+                right = np.minimum(np.searchsorted(keyframe_times, times), len(keyframe_times) - 1)
+                left = np.maximum(right - 1, 0)
+                nearest = np.where(
+                    np.abs(keyframe_times[left] - times) <= np.abs(keyframe_times[right] - times),
+                    keyframe_times[left],
+                    keyframe_times[right]
+                )
+                unique_times, tiles = np.unique(nearest, return_inverse=True)
+                frames = decode_keyframes(
+                    filename=self.__clip.filename,
+                    times=unique_times.tolist(),
+                    size=size,
+                    resize_algo=self.__clip.reader.resize_algo,
+                    workers=workers
+                )
+                return [frames[tile] for tile in tiles]
 
-    def get_frame_array(self, index_time: _utils.Number, get_original: bool = False):
-        frame = self.get_frame(index_time, get_original)
-        array = pygame.surfarray.pixels3d(frame)
+        # clip with effects, the exact frames are read from the clip
+        return list(self.get_frames(times=times, size=size))
 
-        return np.transpose(array, (1, 0, 2))
+    def iter_chunk_cache_frame(self,
+                               max_frame: typing.Optional[int] = None,
+                               workers: typing.Optional[int] = None) -> typing.Generator[tuple[pygame.Surface, int | typing.Literal[-1], range], None, None]:
 
-    def iter_chunk_cache_frame(self) -> typing.Generator[tuple[pygame.Surface, int | typing.Literal[-1], range], None, None]:
         self.__set_effect()
         asserter(
             self.__cache,
             pygame.error("cache doesn't apply to this video")
         )
+        asserter(
+            isinstance(max_frame, int | None),
+            TypeError(f'max_frame must be integers or None, not {name(max_frame)}')
+        )
+        asserter(
+            isinstance(workers, int | None),
+            TypeError(f'workers must be integers or None, not {name(workers)}')
+        )
+        asserter(
+            workers is None or workers > 0,
+            ValueError(f'workers must be greater than 0, not {workers}')
+        )
 
         logger = proglog.default_bar_logger(self.__get_logger())
         range_iterable = range(self.get_total_frame())
+        stop = len(range_iterable) if max_frame is None else max(min(max_frame, len(range_iterable)), 0)
         blank_surface = pygame.Surface((self.__clip.w, self.__clip.h), pygame.SRCALPHA)
+        send_value = None
 
         blank_surface.fill('black')
 
-        logger(message='PyGVideo - Create cache frames')
+        if workers is not None and workers > 1 and self.__clip is not self.__source_clip:
+            warnings.warn(
+                f'From {self.__get_mod()}.iter_chunk_cache_frame: '
+                'Parallel cache building is only available for videos loaded from a filename without any '
+                'effects. The frames will be decoded in a single process.',
+                category=UserWarning,
+                stacklevel=2
+            )
+            workers = None
 
-        for frame_index in logger.iter_bar(index_frame=range_iterable, bar_message=lambda _ : 'Creating cache frames'):
-            try:
-                frame = self.get_frame(frame_index * (1 / self.__clip.fps), get_original=True)
-                self.__add_cache(frame_index, frame)
+        if workers is not None and workers > 1:
+            frames = self.__iter_parallel_frames(stop, workers)
+        else:
+            frames = self.__iter_frames(stop)
 
-                # if the cache can no longer be saved, the generator exits
-                if self.__cache_full:
-                    break
+        logger(message='PyGVideo - Create cache frames')
 
-                send_value = yield (frame, frame_index, range_iterable)
-            except:
-                send_value = yield (blank_surface, frame_index, range_iterable)
+        try:
+            for frame_index in logger.iter_bar(index_frame=range(stop), bar_message=lambda _ : 'Creating cache frames'):
+                frame = next(frames)
+
+                if frame is None:
+                    # error when retrieving the video frame
+                    send_value = yield (blank_surface, frame_index, range_iterable)
+                else:
+                    # frames from the cache builder are not removed by the cache window
+                    self.__add_cache(
+                        self.__cache_key(frame_index),
+                        self.__display_ready(frame) if self.__cache_scaled else frame,
+                        pin=True
+                    )
+
+                    # if the cache can no longer be saved, the generator exits
+                    if self.__cache_full or self.__cache_frames.is_full:
+                        break
+
+                    send_value = yield (frame, frame_index, range_iterable)
+
+                if send_value:
+                    break
 
-            if send_value:
-                break
+        finally:
+            frames.close()
 
-        if self.__cache_full:
+        if self.__cache_full or self.__cache_frames.is_full:
             logger(message='PyGVideo - Done with full memory.')
         elif send_value:
             logger(message=f'PyGVideo - Done with the generator stopped. Reason: {send_value}')
+        elif stop < len(range_iterable):
+            logger(message='PyGVideo - Done with the generator stopped. Reason: Maximum frame reached.')
         else:
             logger(message='PyGVideo - Done.')
 
         yield (blank_surface, -1, range_iterable)
 
+    def __iter_frames(self, stop: int) -> typing.Generator[pygame.Surface | None, None, None]:
+        for frame_index in range(stop):
+            try:
+                if self.__get_render_stream():
+                    frame_surface = self.__decode_frame(frame_index)
+                else:
+                    frame_surface = self.__frame_to_surface(self.__read_frame(frame_index), get_original=True)
+            except:
+                frame_surface = None
+
+            yield frame_surface
+
+    def __iter_parallel_frames(self, stop: int, workers: int) -> typing.Generator[pygame.Surface | None, None, None]:
+        size = self.__size if self.__is_decoding_at_size() else None
+        decoder = ParallelFrameDecoder(
+            filename=self.__clip.filename,
+            reader_kwargs=self.__reader_kwargs(size),
+            fps=self.__clip.fps,
+            shape=size or (self.__clip.w, self.__clip.h),
+            stop=stop,
+            workers=workers,
+            # each worker decodes 1 second chunks, so seeking doesn't take most of the time
+            chunk_size=max(int(self.__clip.fps), 1),
+            index=self.__get_keyframe_index()
+        )
+        frame_store = None if size else self.__get_frame_store()
+
+        try:
+            for frame_index in range(stop):
+                try:
+                    frame = decoder.read(frame_index)
+                except RuntimeError:
+                    yield None
+                    continue
+
+                # the slot is shared with the worker, the surface can't wrap it
+                frame_surface = self.__frame_to_surface(frame, get_original=True)
+
+                if frame_store:
+                    with self.__decode_lock:
+                        frame_store.add(frame_index, frame)
+
+                # the slot can be used by the worker again
+                decoder.release(frame_index)
+
+                yield frame_surface
+        finally:
+            decoder.close()
+
     @property
     def filename_or_clip(self):
         return self.__filename_or_clip
@@ -784,12 +2073,36 @@ class Video:
 
     @property
     def is_cache_full(self) -> bool:
-        return self.__cache_full
+        return self.__cache_full or self.__cache_frames.is_full
+
+    @property
+    def is_frame_store(self) -> bool:
+        return self.__use_frame_store
+
+    @property
+    def is_keyframe_index(self) -> bool:
+        return self.__use_keyframe_index
+
+    @property
+    def is_cache_scaled(self) -> bool:
+        return self.__cache_scaled
+
+    @property
+    def is_decode_at_size(self) -> bool:
+        return self.__decode_at_size
+
+    @property
+    def is_frame_changed(self) -> bool:
+        return self.__frame_changed
 
     @property
     def is_ready(self) -> bool:
         return self.__ready
 
+    @property
+    def is_audio_pending(self) -> bool:
+        return self.__audio_future is not None and not self.__audio_future.done()
+
     @property
     def is_pause(self) -> bool:
         return self.__pause
@@ -800,7 +2113,7 @@ class Video:
             return False
         elif self.__pause:
             return self.__play
-        return self.__play and pygame.mixer.music.get_busy()
+        return self.__play and self.__clock.is_busy()
 
     @property
     def is_mute(self) -> bool:
@@ -835,6 +2148,11 @@ class Video:
             global GLOBALS
             GLOBALS['video-clip'].append(self.__clip)
 
+        # the streams and the frame store are for the old clip
+        if hasattr(self, '_Video__stream'):
+            self.__close_streams()
+            self.__close_frame_store()
+
         self.__clip = new_clip
 
     @size.setter
@@ -849,6 +2167,18 @@ class Video:
     def height(self, new_height: _utils.Number) -> None:
         self.set_size((self.width, new_height))
 
+    @is_frame_store.setter
+    def is_frame_store(self, boolean: bool) -> None:
+        self.set_frame_store(boolean)
+
+    @is_cache_scaled.setter
+    def is_cache_scaled(self, boolean: bool) -> None:
+        self.set_cache_scaled(boolean)
+
+    @is_decode_at_size.setter
+    def is_decode_at_size(self, boolean: bool) -> None:
+        self.set_decode_at_size(boolean)
+
     @is_ready.setter
     def is_ready(self, boolean: bool) -> None:
         if boolean:
@@ -879,7 +2209,8 @@ class Video:
 
     def draw_and_update(self,
                         screen_surface: typing.Optional[pygame.Surface] = None,
-                        pos: typing.Any | pygame.Rect = (0, 0)) -> pygame.Surface:
+                        pos: typing.Any | pygame.Rect = (0, 0),
+                        skip_unchanged: bool = False) -> pygame.Surface:
 
         self.__video_initialized()
         asserter(
@@ -887,40 +2218,105 @@ class Video:
             pygame.error('the video is not playing yet. Use the .play() method before call this method')
         )
 
-        music_pos = pygame.mixer.music.get_pos()
+        clock_time = self.__clock.get_time()
+        late_mode = None
 
-        if music_pos != -1:
-            self.__frame_index = int(((self.__audio_offset + music_pos) / 1000) * self.__clip.fps)
+        if clock_time is not None:
+            # the previous frames were shown late, use the late-frame policy until the video catches up
+            if late_mode := self.__get_late_mode():
+                self.__frame_index = self.__late_frame_index(clock_time, late_mode)
+            else:
+                self.__frame_index = self.__sync_frame_index(clock_time)
         else:
             self.__frame_index = self.get_total_frame()
 
         # logic loops
         if not self.is_play and self.__loops != 0:
-            self.__audio_offset = 0
             self.__video_loops += 1
             self.stop()
             self.play(self.__loops - 1)
 
-        try:
-            # check if the frame index is already in cache_frames, if not it will be loaded and saved to cache_frames
-            if self.__frame_index in self.__cache_frames:
-                frame_surface = self.__cache_frames[self.__frame_index]
-            else:
-                frame_surface = self.get_frame(self.__frame_index * (1 / self.__clip.fps), get_original=True)
-                self.__add_cache(self.__frame_index, frame_surface)
+        self.__trim_cache_window()
 
-            if self.__size:
-                frame_surface = pygame.transform.scale(frame_surface, self.__size)
-        except:
-            # if there is an error in the frame index, it will load an empty surface image
-            size_surface = self.__size if self.__size else (self.__clip.w, self.__clip.h)
-            frame_surface = pygame.Surface(size_surface)
-            frame_surface.fill('black')
+        late_decode = late_mode == 'resolution' or (late_mode == 'keyframe' and self.__late_keyframe_time is not None)
+        # the lower resolution frames are shown again in full quality after the late-frame policy
+        output_key = (self.__frame_index, self.__size, self.__alpha, late_mode == 'resolution')
+        self.__frame_changed = output_key != self.__last_output_key
+
+        if not self.__frame_changed:
+            # the clock is still on the same frame, the composed frame is returned as is
+            frame_surface = self.__last_output
+
+        else:
+            start_time = time.perf_counter()
+            stream_seeks = self.__get_stream_seeks()
+
+            try:
+                if late_decode:
+                    frame_surface = self.__decode_late_frame(self.__frame_index, late_mode)
+                else:
+                    # check if the frame index is already in cache_frames, if not it will be loaded and saved to cache_frames
+                    frame_surface = self.__cache_frames.get(self.__cache_key(self.__frame_index))
+
+                if frame_surface is None:
+                    # take the frame from the prefetch buffer, if it's not ready yet (underrun) it will be decoded here
+                    frame_surface = self.__prefetcher.get(self.__frame_index) if self.__prefetcher else None
+                    if frame_surface is None:
+                        # the frame buffer can be reused if the frame will not be saved to the cache
+                        frame_surface = self.__decode_frame(self.__frame_index, reuse=not self.__cache or self.__cache_full)
+                    frame_surface = self.__cache_decoded(self.__frame_index, frame_surface)
+
+                output_size = self.__size if self.__size else (self.__clip.w, self.__clip.h)
+
+                if frame_surface.get_size() != output_size:
+                    # scale into the output surface instead of allocating a new surface every frame
+                    frame_surface = pygame.transform.scale(
+                        frame_surface,
+                        output_size,
+                        self.__output_surfaces.get(output_size, frame_surface)
+                    )
+
+                self.__last_output_key = output_key
+            except:
+                # if there is an error in the frame index, it will load an empty surface image
+                size_surface = self.__size if self.__size else (self.__clip.w, self.__clip.h)
+                frame_surface = self.__output_surfaces.get(size_surface)
+                frame_surface.fill('black')
+                # try to load the frame again on the next call
+                self.__last_output_key = None
 
-        frame_surface.set_alpha(self.__alpha)
+            frame_surface.set_alpha(self.__alpha)
+            self.__last_output = frame_surface
+
+            # the latency is the time to get a frame in full quality
+            if not late_decode:
+                self.__sync_stats.add_latency(time.perf_counter() - start_time)
+
+        self.__dirty_rect = None
 
         if screen_surface:
-            screen_surface.blit(frame_surface, pos)
+            dest = frame_surface.get_rect(topleft=pos.topleft if isinstance(pos, pygame.Rect) else pos)
+
+            # the frame on the screen surface is already up to date
+            if not (skip_unchanged and not self.__frame_changed and
+                    screen_surface is self.__last_screen and dest == self.__last_dest):
+                rect = screen_surface.blit(frame_surface, pos)
+
+                if self.__frame_changed:
+                    self.__dirty_rect = rect
+                if self.__last_dest is not None and dest != self.__last_dest:
+                    # the frame moved, the old area has to be updated too
+                    self.__dirty_rect = rect.union(self.__last_dest)
+
+            self.__last_screen = screen_surface
+            self.__last_dest = dest
+
+        if clock_time is not None and self.__frame_index != self.__presented_index:
+            self.__present_frame(
+                self.__frame_index,
+                late_mode,
+                startup=self.__frame_changed and self.__get_stream_seeks() != stream_seeks
+            )
 
         return frame_surface
 
@@ -943,6 +2339,21 @@ class Video:
 
         return self
 
+    def load_audio(self) -> concurrent.futures.Future:
+        self.__video_initialized()
+
+        # start writing the temp audio in the background if it isn't written or being written yet
+        if self.__audio_future is None and not self.__audio_file.exists():
+            self.__load_audio(load=True)
+
+        if self.__audio_future is not None:
+            return self.__audio_future
+
+        future = concurrent.futures.Future()
+        future.set_result(None)
+
+        return future
+
     def prepare(self):
         self.__video_initialized()
 
@@ -953,12 +2364,34 @@ class Video:
                 pygame.error('cannot use 2 videos at the same time')
             )
 
-            # if the audio temp is lost or deleted, it will automatically load the audio
-            if not self.__audio_file.exists():
-                self.__load_audio(load=True)
+            # wait for the audio that is prepared in the background
+            self.__wait_audio()
+
+            if self.__user_clock is not None:
+                clock = self.__user_clock
+            elif self.__clip.audio is None:
+                # the video doesn't have audio, it's timed by perf_counter instead of the mixer
+                clock = PerfCounterClock()
+            else:
+                clock = MixerClock()
+
+            # only the mixer clock plays the audio, the other clocks play the video without the mixer
+            if isinstance(clock, MixerClock):
+                asserter(
+                    self.__clip.audio is not None,
+                    pygame.error('the video has no audio to be played by the mixer clock')
+                )
+
+                # if the audio temp is lost or deleted, it will automatically load the audio
+                if not self.__audio_file.exists():
+                    self.__load_audio(load=True)
+                    self.__wait_audio()
+
+                # load audio ke mixer
+                pygame.mixer.music.load(self.__audio_file)
 
-            # load audio ke mixer
-            pygame.mixer.music.load(self.__audio_file)
+            clock.prepare(self.__clip.duration)
+            self.__clock = clock
 
             self.__ready = True
             self.__video_loops = 0
@@ -976,7 +2409,8 @@ class Video:
             self.__ready = False
 
             # unload audio
-            pygame.mixer.music.unload()
+            if isinstance(self.__clock, MixerClock):
+                pygame.mixer.music.unload()
 
             os.environ['PYGAME_VIDEO_USED'] = '0'
 
@@ -998,9 +2432,13 @@ class Video:
             self.__play = True
             self.__loops = loops
             self.__frame_index = 0
-            self.__audio_offset = start * 1000
+            self.__presented_index = None
+            self.__reset_late_frames()
 
-            pygame.mixer.music.play(start=start)
+            self.__clock.play(start)
+
+            if self.__prefetcher:
+                self.__prefetcher.start()
 
         return self
 
@@ -1026,7 +2464,7 @@ class Video:
         if self.__play and not self.__pause:
             self.__pause = True
 
-            pygame.mixer.music.pause()
+            self.__clock.pause()
 
         return self
 
@@ -1037,7 +2475,7 @@ class Video:
         if self.__pause:
             self.__pause = False
 
-            pygame.mixer.music.unpause()
+            self.__clock.unpause()
 
         return self
 
@@ -1115,7 +2553,7 @@ class Video:
             return self.previous(abs(distance))
         return self.next(distance)
 
-    def create_cache_frame(self, max_frame: typing.Optional[int] = None):
+    def create_cache_frame(self, max_frame: typing.Optional[int] = None, workers: typing.Optional[int] = None):
         asserter(
             isinstance(max_frame, int | None),
             TypeError(f'max_frame must be integers or None, not {name(max_frame)}')
@@ -1131,22 +2569,11 @@ class Video:
             stacklevel=2
         )
 
-        if max_frame is None:
-            max_frame = float('inf')
-        else:
-            if max_frame <= 0:
-                return self
-
-            # subtract 2 because the index value is offset by 2 indices
-            max_frame -= 2
-
-        func = self.iter_chunk_cache_frame()
+        if max_frame is not None and max_frame <= 0:
+            return self
 
-        for _, index, _ in func:
-            if index > max_frame:
-                func.send('Maximum frame reached.')
-                func.close()
-                break
+        for _ in self.iter_chunk_cache_frame(max_frame, workers):
+            pass
 
         return self
 
@@ -1156,15 +2583,44 @@ class Video:
 
         return self
 
+    def clear_sync_stats(self):
+        self.__video_initialized()
+        self.__sync_stats.clear()
+
+        return self
+
+    def log_sync_stats(self):
+        self.__video_initialized()
+
+        logger = proglog.default_bar_logger(self.__get_logger())
+        stats = self.__sync_stats.get_stats()
+
+        if stats['frames'] == 0:
+            logger(message='PyGVideo - Sync: no frames presented yet.')
+        else:
+            logger(
+                message=f"PyGVideo - Sync: {stats['frames']} frames, drift mean {stats['mean']:.1f} ms, "
+                        f"p95 {stats['p95']:.1f} ms, max {stats['max']:.1f} ms, latency {stats['latency']:.1f} ms, "
+                        f"dropped {stats['dropped']}, held {stats['held']}, late {stats['late']}"
+            )
+
+        return self
+
     def reset(self):
         self.__set_effect()
 
+        # the audio is the same as the original audio if no audio effects were applied
+        audio_changed = bool(self.__audio_effects)
+
         self.clip = self.__original_clip.copy()
+        self.__effects.clear()
+        self.__audio_effects.clear()
         self.__size = None
         self.__alpha = 255
 
-        self.__unload_audio()
-        self.__load_audio()
+        if audio_changed:
+            self.__unload_audio()
+            self.__load_audio()
 
         return self
 
@@ -1172,19 +2628,43 @@ class Video:
                      _effect_s_or_method_: _utils.MoviePyFx | tuple[_utils.MoviePyFx] | list[_utils.MoviePyFx] | _utils.NameMethod,
                      *args, **kwargs):
 
+        return self.__with_effects(_effect_s_or_method_, args, kwargs)
+
+    def __with_effects(self,
+                       effect_s_or_method: _utils.MoviePyFx | tuple[_utils.MoviePyFx] | list[_utils.MoviePyFx] | _utils.NameMethod,
+                       args: tuple,
+                       kwargs: dict,
+                       audio_edit: typing.Callable[[np.ndarray, int], np.ndarray] | None = None):
+
+        # audio_edit makes the audio of the new clip from the pcm of the current audio
         self.__set_effect()
 
-        if not isinstance(_effect_s_or_method_, _utils.NameMethod):
-            if isinstance(_effect_s_or_method_, tuple | list):
-                self.clip = self.__clip.with_effects(_effect_s_or_method_)
+        duration = self.__clip.duration
+
+        if not isinstance(effect_s_or_method, _utils.NameMethod):
+            if isinstance(effect_s_or_method, tuple | list):
+                self.clip = self.__clip.with_effects(effect_s_or_method)
+                effect_description = repr(list(effect_s_or_method))
+                effect_names = [type(effect).__name__ for effect in effect_s_or_method]
             else:
-                self.clip = self.__clip.with_effects((_effect_s_or_method_(*args, **kwargs),))
+                effect = effect_s_or_method(*args, **kwargs)
+                self.clip = self.__clip.with_effects((effect,))
+                effect_description = repr(effect)
+                effect_names = [type(effect).__name__]
         else:
-            method = getattr(self.__clip, _effect_s_or_method_)
+            method = getattr(self.__clip, effect_s_or_method)
             self.clip = method(*args, **kwargs)
+            effect_description = f'{effect_s_or_method}(*{args!r}, **{kwargs!r})'
+            effect_names = [effect_s_or_method]
 
-        self.__unload_audio()
-        self.__load_audio()
+        self.__effects.append(effect_description)
+
+        # the audio is only written again if the effect can change it, the silent part of
+        # the audio depends on the duration
+        if (not _constants.VIDEO_ONLY_EFFECTS.issuperset(effect_names) or
+                self.__clip.duration != duration):
+            self.__audio_effects.append(effect_description)
+            self.__reload_audio(audio_edit)
 
         return self
 
@@ -1212,6 +2692,9 @@ class Video:
         cuts_video = []
         current_pos = 0
         i = 0
+        # the audio of each part is sliced from the pcm of this video if it has been written
+        samples = self.__get_audio_samples()
+        fps = self.__audio_fps
 
         logger(message='PyGVideo - Split videos')
 
@@ -1231,6 +2714,8 @@ class Video:
                     *args, **kwargs
                 )
             )
+            if samples is not None:
+                cuts_video[-1].__set_audio_samples(samples[int(current_pos * fps):int(pos * fps)], fps)
             current_pos = pos
             i += 1
 
@@ -1241,6 +2726,8 @@ class Video:
                 *args, **kwargs
             )
         )
+        if samples is not None:
+            cuts_video[-1].__set_audio_samples(samples[int(current_pos * fps):], fps)
 
         logger(message='PyGVideo - Done.')
 
@@ -1288,7 +2775,7 @@ class Video:
                 channel += 1
 
             try:
-                frame = self.__clip.get_frame(frame_index * (1 / self.__clip.fps))
+                frame = self.__read_frame(frame_index)
                 channel_frame = np.zeros_like(frame)
                 channel_frame[:, :, channel] = frame[:, :, channel]
                 frames.append(channel_frame)
@@ -1339,7 +2826,8 @@ class Video:
             ValueError(f'loops must be greater than 0, not {loops}')
         )
 
-        return self.with_effects(fx.Loop, loops)
+        # the audio is repeated from the pcm instead of decoding the looped audio
+        return self.__with_effects(fx.Loop, (loops,), {}, audio_edit=lambda samples, fps : np.tile(samples, (loops, 1)))
 
     def resize(self, scale_or_size: _utils.Number | tuple[_utils.Number, _utils.Number] | list[_utils.Number]):
         if isinstance(scale_or_size, _utils.Number):
@@ -1377,7 +2865,16 @@ class Video:
             TypeError(f'end must be integers or floats, not {name(end)}')
         )
 
-        return self.with_effects('subclipped', start, end)
+        # same time range as subclipped, negative times are counted from the end
+        duration = self.__clip.duration
+        start_time = start + duration if start < 0 else start
+        end_time = duration if end is None else (end + duration if end < 0 else end)
+
+        # the audio is sliced from the pcm, the time it takes depends on the length of the cut
+        return self.__with_effects(
+            'subclipped', (start, end), {},
+            audio_edit=lambda samples, fps : samples[int(start_time * fps):int(end_time * fps)]
+        )
 
     def reverse(self, step_sub: _utils.Number = 0.01, max_retries: int = 12):
         asserter(
@@ -1408,6 +2905,10 @@ class Video:
         current_time = self.__clip.duration
         time_func = lambda t : self.__clip.duration - t # in moviepy 2.1.1: self.__clip.duration - t - 1
         apply_to = ('mask', 'audio')
+        is_reversed = False
+
+        # the errors of cut are retried below, a failed background audio job must raise here
+        self.__wait_audio()
 
         while max_retries > 0:
             try:
@@ -1419,6 +2920,9 @@ class Video:
                 self.clip = self.__clip.time_transform(time_func=time_func,
                                                        apply_to=apply_to,
                                                        keep_duration=True)
+                self.__effects.append('time_mirror()')
+                self.__audio_effects.append('time_mirror()')
+                is_reversed = True
                 break
             except:
                 current_time -= step_sub
@@ -1426,6 +2930,10 @@ class Video:
                 if current_time <= 0:
                     break
 
+        if is_reversed:
+            # the audio is reversed too
+            self.__reload_audio(lambda samples, fps : samples[::-1])
+
         return self
 
     def concatenate_clip(self,
@@ -1440,26 +2948,65 @@ class Video:
             typeerror(x)
         )
 
+        # the audio of the other videos is joined after the clip is changed, their failed audio jobs raise here
+        for other in (clip_or_clips if isinstance(clip_or_clips, tuple | list) else [clip_or_clips]):
+            if isinstance(other, Video):
+                other.__wait_audio()
+
         if isinstance(clip_or_clips, tuple | list):
             clips = []
             for c in clip_or_clips:
                 check(c)
                 clips.append(c if isinstance(c, _utils.SupportsClip) else c.clip)
+            others = list(clip_or_clips)
             self.clip = concatenate_videoclips((self.__clip, *clips), *args, **kwargs)
 
         elif isinstance(clip_or_clips, _utils.SupportsClip | Video):
             check(clip_or_clips)
             clip = clip_or_clips if isinstance(clip_or_clips, _utils.SupportsClip) else clip_or_clips.clip
+            others = [clip_or_clips]
             self.clip = concatenate_videoclips((self.__clip, clip), *args, **kwargs)
 
         else:
             raise typeerror(clip_or_clips)
 
-        self.__unload_audio()
-        self.__load_audio()
+        # the concatenated clips can't be identified
+        self.__effects.append(None)
+        self.__audio_effects.append(None)
+
+        if args or kwargs.get('padding') or kwargs.get('transition') is not None:
+            # the clips overlap or have gaps, the audio is made from the new clip
+            self.__reload_audio()
+        else:
+            # the clips are joined one after another, so the audio is joined from the pcm of each clip
+            self.__reload_audio(
+                lambda samples, fps : np.concatenate(
+                    [samples] +
+                    [samples if other is self else self.__get_clip_samples(other, fps, samples.shape[1]) for other in others]
+                )
+            )
 
         return self
 
+    def __get_clip_samples(self,
+                           clip_or_video: typing.Union[_utils.SupportsClip, 'Video'],
+                           fps: int,
+                           channels: int) -> np.ndarray:
+
+        # the pcm of a Video is reused if its audio has been written, other clips are decoded
+        if isinstance(clip_or_video, Video):
+            samples = clip_or_video.__get_audio_samples()
+            if samples is not None and clip_or_video.__audio_fps == fps:
+                return fit_samples(samples, int(clip_or_video.clip.duration * fps), channels)
+            clip_or_video = clip_or_video.clip
+
+        length = int(clip_or_video.duration * fps)
+
+        if clip_or_video.audio is None:
+            return np.zeros((length, channels), dtype=np.int16)
+
+        return fit_samples(decode_audio(clip_or_video.audio, fps), length, channels)
+
     def add_volume(self, add: _utils.Number, max_volume: _utils.Number = 1, set: bool = False):
         asserter(
             isinstance(add, _utils.Number),
@@ -1515,21 +3062,197 @@ class Video:
         self.__video_initialized()
 
         if size is None:
-            self.__size = None
-            return
+            new_size = None
+        else:
+            size_len = len(size)
+
+            asserter(
+                isinstance(size, tuple | list),
+                TypeError(f'size must be tuples, lists or None, not {name(size)}')
+            )
+            asserter(
+                size_len == 2,
+                ValueError(f'size must contain 2 values, not {size_len}')
+            )
+
+            new_size = tuple(map(int, size))
+
+        if new_size != self.__size:
+            self.__reset_render_stream()
+            # display-ready frames in the old size are no longer used
+            if self.__cache_scaled:
+                self.__remove_cache_size(self.__size)
+
+        self.__size = new_size
+
+        return self
+
+    def set_keyframe_index(self, boolean: bool):
+        self.__video_initialized()
+
+        boolean = bool(boolean)
+
+        if boolean and self.__keyframe_index is None and self.__source_clip is not None:
+            try:
+                self.__keyframe_index = load_frame_index(self.__source_clip.filename, _utils.get_cache_dir())
+            except OSError as e:
+                raise pygame.error(f'cannot build the keyframe index: {e}') from e
+
+        if boolean != self.__use_keyframe_index:
+            # the frames are read by their presentation time, the readers and the decoded frames are no longer valid
+            with self.__decode_lock:
+                self.__close_streams()
+                self.__close_frame_store()
+                self.clear_cache_frame()
+                self.__use_keyframe_index = boolean
+
+            if self.__prefetcher:
+                self.__prefetcher.flush()
+
+        return self
+
+    def set_frame_store(self, boolean: bool):
+        self.__video_initialized()
 
-        size_len = len(size)
+        self.__use_frame_store = bool(boolean)
 
+        if not self.__use_frame_store:
+            self.__close_frame_store()
+
+        return self
+
+    def set_cache_window(self,
+                         behind: _utils.SecondsValue | None,
+                         ahead: typing.Optional[_utils.SecondsValue] = None):
+
+        self.__video_initialized()
         asserter(
-            isinstance(size, tuple | list),
-            TypeError(f'size must be tuples, lists or None, not {name(size)}')
+            isinstance(behind, _utils.SecondsValue | None),
+            TypeError(f'behind must be integers, floats or None, not {name(behind)}')
+        )
+        asserter(
+            isinstance(ahead, _utils.SecondsValue | None),
+            TypeError(f'ahead must be integers, floats or None, not {name(ahead)}')
+        )
+
+        if behind is None:
+            self.__cache_window = None
+            return self
+
+        if ahead is None:
+            ahead = behind
+
+        asserter(
+            behind >= 0 and ahead >= 0,
+            ValueError('behind and ahead cannot be negative values')
+        )
+
+        self.__cache_window = (behind, ahead)
+        self.__cache_window_index = -1
+
+        # the frames ahead are filled in the background by the prefetch worker
+        if (ahead_frames := int(ahead * self.__clip.fps)) > self.get_prefetch():
+            self.set_prefetch(ahead_frames)
+
+        return self
+
+    def set_cache_scaled(self, boolean: bool):
+        self.__video_initialized()
+
+        boolean = bool(boolean)
+
+        if not boolean and self.__cache_scaled and self.__size:
+            self.__remove_cache_size(self.__size)
+
+        self.__cache_scaled = boolean
+
+        return self
+
+    def set_decode_at_size(self, boolean: bool):
+        self.__video_initialized()
+
+        boolean = bool(boolean)
+
+        if boolean != self.__decode_at_size:
+            self.__reset_render_stream()
+            # the reader of the keyframe index is opened in the full size
+            self.__close_streams()
+
+        self.__decode_at_size = boolean
+
+        return self
+
+    def set_prefetch(self, frames: int):
+        self.__video_initialized()
+        asserter(
+            isinstance(frames, int),
+            TypeError(f'frames must be integers, not {name(frames)}')
+        )
+        asserter(
+            frames >= 0,
+            ValueError(f'frames cannot be negative values, not {frames}')
+        )
+
+        if self.__prefetcher:
+            self.__prefetcher.stop()
+            self.__prefetcher = None
+
+        if frames > 0:
+            self.__prefetcher = FramePrefetcher(
+                decode=self.__decode_frame,
+                target=self.__clock_frame_index,
+                frames=frames
+            )
+            if self.__play:
+                self.__prefetcher.start()
+
+        return self
+
+    def set_clock(self, clock: Clock | typing.Callable[[], _utils.SecondsValue | None] | None):
+        self.__video_initialized()
+        asserter(
+            clock is None or isinstance(clock, Clock) or callable(clock),
+            TypeError(f'clock must be Clock, callable or None, not {name(clock)}')
+        )
+        asserter(
+            not self.__ready,
+            pygame.error('cannot change the clock of a ready video. Use the .release() method first')
         )
+
+        # a function that returns the time in seconds is an external timeline
+        if clock is not None and not isinstance(clock, Clock):
+            clock = CallbackClock(clock)
+
+        self.__user_clock = clock
+
+        return self
+
+    def set_sync_correction(self, policy: typing.Literal['drop', 'hold', 'both'] | None):
+        self.__video_initialized()
+        asserter(
+            policy in ('drop', 'hold', 'both', None),
+            ValueError(f"policy must be 'drop', 'hold', 'both' or None, not {policy!r}")
+        )
+
+        self.__sync_correction = policy
+
+        return self
+
+    def set_late_frame_policy(self, policy: typing.Literal['skip', 'keyframe', 'resolution'] | None):
+        self.__video_initialized()
         asserter(
-            size_len == 2,
-            ValueError(f'size must contain 2 values, not {size_len}')
+            policy in ('skip', 'keyframe', 'resolution', None),
+            ValueError(f"policy must be 'skip', 'keyframe', 'resolution' or None, not {policy!r}")
         )
 
-        self.__size = tuple(map(int, size))
+        if policy == 'keyframe' and self.__keyframe_index is None and self.__source_clip is not None:
+            try:
+                self.__keyframe_index = load_frame_index(self.__source_clip.filename, _utils.get_cache_dir())
+            except OSError as e:
+                raise pygame.error(f'cannot build the keyframe index: {e}') from e
+
+        self.__late_policy = policy
+        self.__reset_late_frames()
 
         return self
 
@@ -1546,7 +3269,10 @@ class Video:
 
         self.__stop()
 
-        self.__clip.audio = self.__fill_audio_with_silent(audio)
+        # the audio is padded with silence to the duration of the video when it's written
+        self.__clip.audio = audio
+        # the new audio can't be identified
+        self.__audio_effects.append(None)
 
         self.__unload_audio()
         self.__load_audio()
@@ -1592,7 +3318,7 @@ class Video:
 
         return self
 
-    def set_pos(self, pos: _utils.SecondsValue):
+    def set_pos(self, pos: _utils.SecondsValue, keyframe: bool = False):
         self.__video_initialized()
         self.__audio_loaded()
         asserter(
@@ -1600,15 +3326,25 @@ class Video:
             TypeError(f'pos must be a integers or floats, not {name(pos)}')
         )
 
-        self.__audio_offset = pos * 1000
-
-        if 0 <= self.__audio_offset <= self.get_duration():
-            pygame.mixer.music.stop()
-            pygame.mixer.music.play(start=pos)
-            if self.__pause:
-                pygame.mixer.music.pause()
+        if keyframe and (keyframe_index := self.__get_keyframe_index()):
+            # move to the nearest keyframe before pos, the frame is shown without decoding the frames before it
+            pos = keyframe_index.get_time(keyframe_index.get_keyframe(keyframe_index.get_frame_index(pos)))
+
+        if 0 <= pos * 1000 <= self.get_duration():
+            self.__clock.seek(pos, self.__pause)
+            self.__presented_index = None
+            self.__reset_late_frames()
+
+            # buffered frames are no longer valid, re-prime from the new position
+            if self.__prefetcher:
+                if self.__cache_window:
+                    # keep the frames ahead in the cache, so seeking back to them doesn't decode them again
+                    for frame_index, frame_surface in self.__prefetcher.drain():
+                        self.__cache_decoded(frame_index, frame_surface)
+                else:
+                    self.__prefetcher.flush()
         else:
-            raise ValueError(f'pos {self.__audio_offset} is out of music range')
+            raise ValueError(f'pos {pos * 1000} is out of music range')
 
         return self
 
@@ -1693,6 +3429,13 @@ class Video:
     def quit(self):
         if not self.__quit:
             # close up all assets
+            if self.__prefetcher:
+                self.__prefetcher.stop()
+            # the audio job reads the clip, wait for it before closing the clip
+            self.__cancel_audio()
+            self.__close_frame_iterator()
+            self.__close_streams()
+            self.__close_frame_store()
             self.clear_cache_frame()
             self.__clip.close()
             self.__original_clip.close()
@@ -1741,7 +3484,7 @@ def unmute_debug() -> None:
 
 def quit(show_log: bool = True) -> None:
     # stop the audio
-    if pygame.get_init():
+    if pygame.get_init() and pygame.mixer.get_init():
         pygame.mixer.music.stop()
 
     global GLOBALS
@@ -0,0 +1,331 @@
+import signal
+import typing
+import subprocess as sp
+import numpy as np
+import multiprocessing
+from moviepy.config import FFMPEG_BINARY
+from moviepy.tools import (
+    cross_platform_popen_params,
+    ffmpeg_escape_filename
+)
+from moviepy.video.io.ffmpeg_reader import FFMPEG_VideoReader
+
+from ._index import FrameIndex
+from ._utils import os
+from . import _utils
+
+class KeyframeReader(FFMPEG_VideoReader):
+
+    def __init__(self, filename: _utils.Path, index: FrameIndex, **kwargs) -> None:
+        self.index = index
+        super().__init__(filename, **kwargs)
+
+    def initialize(self, start_time: _utils.SecondsValue = 0) -> None:
+        # seek to the exact presentation time of the frame at start_time, ffmpeg decodes from the nearest keyframe
+        # and drops the frames before it. Every frame after it is sent to the pipe as is, so the frame position
+        # follows the index (variable frame rate)
+        self.close(delete_lastread=False)
+
+        frame_index = self.index.get_frame_index(start_time)
+        i_arg = ['-i', ffmpeg_escape_filename(self.filename)]
+
+        if frame_index != 0:
+            i_arg = ['-ss', '%.06f' % (self.index.get_time(frame_index) - 0.0005)] + i_arg
+
+        cmd = (
+            [FFMPEG_BINARY]
+            + i_arg
+            + [
+                '-loglevel',
+                'error',
+                '-f',
+                'image2pipe',
+                '-vf',
+                'scale=%d:%d' % tuple(self.size),
+                '-sws_flags',
+                self.resize_algo,
+                '-vsync',
+                'passthrough',
+                '-pix_fmt',
+                self.pixel_format,
+                '-vcodec',
+                'rawvideo',
+                '-'
+            ]
+        )
+
+        popen_params = cross_platform_popen_params(
+            {
+                'bufsize': self.bufsize,
+                'stdout': sp.PIPE,
+                'stderr': sp.PIPE,
+                'stdin': sp.DEVNULL
+            }
+        )
+
+        self.proc = sp.Popen(cmd, **popen_params)
+        self.pos = frame_index
+        self.last_read = self.read_frame()
+
+    def get_frame_number(self, t: _utils.SecondsValue) -> int:
+        return self.index.get_frame_index(t)
+
+class FrameStream:
+
+    def __init__(self,
+                 clip: _utils.SupportsClip | None,
+                 filename: _utils.Path | None = None,
+                 reader_kwargs: dict | None = None,
+                 threshold: int = 100,
+                 fps: _utils.Number | None = None,
+                 index: FrameIndex | None = None) -> None:
+
+        # if the filename is given, the stream will open its own ffmpeg reader so the cursor
+        # is not moved by other clip readers (draw_and_update, get_frame, etc.)
+        self.__clip = clip
+        self.__fps = fps or clip.fps
+        self.__filename = filename
+        self.__reader_kwargs = reader_kwargs or dict()
+        self.__threshold = threshold
+        # frame index of the file, the frames are read by their position in the index instead of the frame rate
+        self.__index = index
+        self.__reader = None
+        self.__buffer = None
+        self.__seeks = 0
+
+    def __open_reader(self) -> FFMPEG_VideoReader:
+        if self.__index is not None:
+            return KeyframeReader(self.__filename, self.__index, **self.__reader_kwargs)
+
+        reader = FFMPEG_VideoReader(self.__filename, **self.__reader_kwargs)
+        # use the same frame rate as the clip to calculate the frame time
+        reader.fps = self.__fps
+        return reader
+
+    def __get_time(self, index: int) -> float:
+        if self.__index is not None:
+            return self.__index.get_time(index)
+        return index * (1 / self.__fps)
+
+    def __can_skip(self, index: int) -> bool:
+        return self.__reader.pos <= index <= self.__reader.pos + self.__threshold
+
+    def read(self, index: int) -> np.ndarray:
+        if self.__filename is None:
+            return self.__clip.get_frame(index * (1 / self.__fps))
+
+        if self.__reader is None:
+            self.__reader = self.__open_reader()
+            self.__seeks += 1
+            if index != 0:
+                self.__reader.initialize(self.__get_time(index))
+            frame = self.__reader.last_read
+
+        # self.__reader.pos is the index of the next frame that will be read
+        elif index == self.__reader.pos - 1:
+            frame = self.__reader.last_read
+            # the last frame was read into the buffer of read_into, it will be overwritten later
+            if frame is self.__buffer:
+                frame = frame.copy()
+
+        elif self.__can_skip(index):
+            # monotonic access, move the cursor forward without seeking
+            self.__reader.skip_frames(index - self.__reader.pos)
+            frame = self.__reader.read_frame()
+
+        else:
+            # discontinuity, seek with a new ffmpeg process
+            self.__reader.initialize(self.__get_time(index))
+            self.__seeks += 1
+            frame = self.__reader.last_read
+
+        # remove the alpha channel (pixel format rgba)
+        if frame.shape[2] == 4:
+            return frame[:, :, :3]
+
+        return frame
+
+    def close(self) -> None:
+        if self.__reader:
+            self.__reader.close()
+            self.__reader = None
+            self.__buffer = None
+
+    def read_into(self, index: int, out: np.ndarray) -> None:
+        reader = self.__reader
+
+        if (reader is not None and reader.depth == 3 and out.flags.c_contiguous and
+                out.nbytes == reader.depth * reader.size[0] * reader.size[1] and self.__can_skip(index)):
+            # read the raw frame from the ffmpeg pipe directly into out, no frame is allocated
+            reader.skip_frames(index - reader.pos)
+            if reader.proc.stdout.readinto(memoryview(out).cast('B')) == out.nbytes:
+                reader.last_read = self.__buffer = out
+            elif reader.last_read is not out:
+                # end of the stream, use the last valid frame like the reader does
+                out[...] = reader.last_read
+            reader.pos += 1
+            return
+
+        out[...] = self.read(index)
+
+    @property
+    def seeks(self) -> int:
+        return self.__seeks
+
+    @property
+    def is_sequential(self) -> bool:
+        return self.__filename is not None
+
+def iter_filtered_frames(filename: _utils.Path,
+                         size: tuple[int, int],
+                         filters: list[str],
+                         resize_algo: str = 'bicubic') -> typing.Generator[np.ndarray, None, None]:
+
+    # decode the frames that pass the ffmpeg filters (select, fps, etc.), the other frames are dropped by ffmpeg
+    # before they are scaled, converted and sent to the pipe
+    width, height = size
+    cmd = [
+        FFMPEG_BINARY,
+        '-i', ffmpeg_escape_filename(filename),
+        '-loglevel', 'error',
+        '-map', '0:v:0',
+        '-f', 'image2pipe',
+        '-vf', ','.join(filters + [f'scale={width}:{height}']),
+        '-sws_flags', resize_algo,
+        '-vsync', 'passthrough',
+        '-pix_fmt', 'rgb24',
+        '-vcodec', 'rawvideo',
+        '-'
+    ]
+    popen_params = cross_platform_popen_params(
+        {
+            'bufsize': width * height * 3 + 100,
+            'stdout': sp.PIPE,
+            'stderr': sp.DEVNULL,
+            'stdin': sp.DEVNULL
+        }
+    )
+
+    proc = sp.Popen(cmd, **popen_params)
+
+    try:
+        while True:
+            frame = np.empty((height, width, 3), dtype=np.uint8)
+            if proc.stdout.readinto(memoryview(frame).cast('B')) != frame.nbytes:
+                return
+            yield frame
+    finally:
+        proc.terminate()
+        proc.stdout.close()
+        proc.wait()
+
+def decode_chunks(filename: _utils.Path,
+                  reader_kwargs: dict,
+                  fps: _utils.Number,
+                  stop: int,
+                  chunk_size: int,
+                  worker: int,
+                  workers: int,
+                  buffer,
+                  shape: tuple[int, int],
+                  free_slots,
+                  ready_slots,
+                  index: FrameIndex | None = None) -> None:
+
+    # runs in a worker process. The timeline is split into chunks of chunk_size frames, the worker
+    # decodes every workers-th chunk into its ring buffer (shared memory) of chunk_size slots.
+    # the forked process inherits the signal handler of pygame, restore it so terminate works
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+    width, height = shape
+    slots = np.frombuffer(buffer, dtype=np.uint8).reshape((chunk_size, height, width, 3))
+    stream = FrameStream(None, filename, reader_kwargs, fps=fps, index=index)
+
+    try:
+        for start in range(worker * chunk_size, stop, workers * chunk_size):
+            for frame_index in range(start, min(start + chunk_size, stop)):
+                # wait until the slot is copied by the main process
+                free_slots.acquire()
+                stream.read_into(frame_index, slots[frame_index % chunk_size])
+                ready_slots.release()
+    finally:
+        stream.close()
+
+class ParallelFrameDecoder:
+
+    def __init__(self,
+                 filename: _utils.Path,
+                 reader_kwargs: dict,
+                 fps: _utils.Number,
+                 shape: tuple[int, int],
+                 stop: int,
+                 workers: int,
+                 chunk_size: int,
+                 index: FrameIndex | None = None) -> None:
+
+        width, height = shape
+        # the workers are spawned instead of forked, a forked worker would copy the threads, the locks and the
+        # SDL state of the parent process. decode_chunks is imported again by every worker, so the program that
+        # starts the workers must be guarded with if __name__ == '__main__'
+        context = multiprocessing.get_context('spawn')
+
+        self.__chunk_size = chunk_size
+        self.__workers = workers
+        self.__slots = []
+        self.__free_slots = []
+        self.__ready_slots = []
+        self.__processes = []
+
+        for worker in range(workers):
+            buffer = context.RawArray('B', chunk_size * height * width * 3)
+            free_slots = context.Semaphore(chunk_size)
+            ready_slots = context.Semaphore(0)
+
+            process = context.Process(
+                target=decode_chunks,
+                args=(filename, reader_kwargs, fps, stop, chunk_size, worker, workers,
+                      buffer, shape, free_slots, ready_slots, index),
+                name=f'pygvideo-decoder-{worker}',
+                daemon=True
+            )
+
+            self.__slots.append(np.frombuffer(buffer, dtype=np.uint8).reshape((chunk_size, height, width, 3)))
+            self.__free_slots.append(free_slots)
+            self.__ready_slots.append(ready_slots)
+            self.__processes.append(process)
+
+        # the spawned workers import pygame and pygvideo again, hide their support prompts
+        prompts = {'PYGAME_HIDE_SUPPORT_PROMPT': '1', 'PYGAME_VIDEO_HIDE_SUPPORT_PROMPT': '1'}
+        environ = {name: os.environ.get(name) for name in prompts}
+        os.environ.update(prompts)
+
+        try:
+            for process in self.__processes:
+                process.start()
+        finally:
+            for name, value in environ.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+
+    def read(self, index: int, timeout: float = 1) -> np.ndarray:
+        # frames must be read in order, the frame is valid until release is called
+        worker = (index // self.__chunk_size) % self.__workers
+
+        while not self.__ready_slots[worker].acquire(timeout=timeout):
+            if not self.__processes[worker].is_alive():
+                raise RuntimeError(f'decoder worker {worker} stopped at frame index {index}')
+
+        return self.__slots[worker][index % self.__chunk_size]
+
+    def release(self, index: int) -> None:
+        self.__free_slots[(index // self.__chunk_size) % self.__workers].release()
+
+    def close(self) -> None:
+        for process in self.__processes:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+
+        self.__processes.clear()
@@ -0,0 +1,132 @@
+import json
+import hashlib
+import threading
+import numpy as np
+from numpy.lib.format import open_memmap
+from ._utils import (
+    PathL as Path,
+    os
+)
+from . import _utils
+
+# keys of the frame stores opened by this process, an open store is never removed
+_open_keys: set[str] = set()
+_open_keys_lock = threading.Lock()
+
+def get_store_size(shape: tuple[int, int, int]) -> int:
+    # bytes of the data file and the index file of a store with the shape (total frame, height, width)
+    total_frame, height, width = shape
+    return total_frame * height * width * 3 + total_frame
+
+def evict_frame_stores(directory: _utils.Path, max_size: int, keep: str | None = None) -> None:
+    # remove the least recently used frame stores (except keep) until the other stores fit in max_size bytes
+    stores = {}
+
+    for file in Path(directory).glob('*.frames.npy'):
+        key = file.name.removesuffix('.frames.npy')
+        if key == keep:
+            continue
+        files = (file, file.with_name(f'{key}.index.npy'))
+        try:
+            stats = [f.stat() for f in files if f.exists()]
+        except OSError:
+            continue
+        stores[key] = (max(s.st_mtime for s in stats), sum(s.st_size for s in stats), files)
+
+    total_size = sum(size for _, size, _ in stores.values())
+
+    for key, (_, size, files) in sorted(stores.items(), key=lambda item: item[1][0]):
+        if total_size <= max_size:
+            break
+
+        with _open_keys_lock:
+            if key in _open_keys:
+                continue
+
+        try:
+            for file in files:
+                if file.exists():
+                    os.remove(file)
+            total_size -= size
+        except OSError:
+            pass
+
+def get_source_key(filename: _utils.Path, *identity: object) -> str | None:
+    # key of the source file (path, modification time and size) and anything that changes the frames
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+
+    source = json.dumps(
+        [os.path.abspath(filename), stat.st_mtime_ns, stat.st_size, *map(repr, identity)]
+    )
+
+    return hashlib.sha1(source.encode('utf-8')).hexdigest()
+
+class FrameStore:
+
+    def __init__(self, directory: _utils.Path, key: str, shape: tuple[int, int, int]) -> None:
+        # shape is (total frame, height, width)
+        total_frame, height, width = shape
+
+        self.__key = key
+        self.__data_file = Path(directory) / f'{key}.frames.npy'
+        self.__index_file = Path(directory) / f'{key}.index.npy'
+        self.__data = None
+        self.__index = None
+
+        self.__data_file.parent.mkdir(parents=True, exist_ok=True)
+
+        with _open_keys_lock:
+            _open_keys.add(key)
+
+        try:
+            self.__data = open_memmap(self.__data_file, mode='r+')
+            self.__index = open_memmap(self.__index_file, mode='r+')
+            if self.__data.shape != (total_frame, height, width, 3) or self.__index.shape != (total_frame,):
+                raise ValueError('frame store shape mismatch')
+            # mark the store as recently used
+            os.utime(self.__data_file)
+        except (OSError, ValueError):
+            # the store doesn't exist yet or it's broken, create a new store
+            self.__data = open_memmap(self.__data_file, mode='w+', dtype=np.uint8, shape=(total_frame, height, width, 3))
+            self.__index = open_memmap(self.__index_file, mode='w+', dtype=np.bool_, shape=(total_frame,))
+
+    def __contains__(self, index: int) -> bool:
+        return 0 <= index < len(self.__index) and bool(self.__index[index])
+
+    def get(self, index: int, out: np.ndarray | None = None) -> np.ndarray:
+        # the frame is copied out of the memory map (into out if it's given), so changing the returned frame or a
+        # surface that wraps it never writes to the store file
+        if out is None:
+            return np.array(self.__data[index])
+
+        np.copyto(out, self.__data[index])
+        return out
+
+    def add(self, index: int, frame: np.ndarray) -> None:
+        if not (0 <= index < len(self.__index)) or frame.shape != self.__data.shape[1:]:
+            return
+
+        self.__data[index] = frame
+        self.__index[index] = True
+
+    def close(self) -> None:
+        if self.__data is not None:
+            # write the frames before the index, so the index never points to an unwritten frame
+            self.__data.flush()
+            self.__index.flush()
+            self.__data = None
+            self.__index = None
+
+            with _open_keys_lock:
+                _open_keys.discard(self.__key)
+
+    @property
+    def total_frame(self) -> int:
+        return int(np.count_nonzero(self.__index))
+
+    @property
+    def data_file(self) -> Path:
+        return self.__data_file
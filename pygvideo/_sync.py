@@ -0,0 +1,62 @@
+import numpy as np
+from collections import deque
+
+class SyncStats:
+
+    def __init__(self, max_frames: int) -> None:
+        # drift (in seconds) of the last presented frames, the clock time when the frame is presented minus
+        # the presentation time of the frame. Positive if the video is behind the clock
+        self.__drifts: deque[float] = deque(maxlen=max_frames)
+        self.__frames = 0
+        self.__dropped = 0
+        self.__held = 0
+        self.__late = 0
+        # moving average of the time to get a new frame (decode, cache, scale), in seconds
+        self.__latency = 0.0
+
+    def add_drift(self, drift: float) -> None:
+        self.__drifts.append(drift)
+        self.__frames += 1
+
+    def add_latency(self, latency: float) -> None:
+        if self.__latency == 0:
+            self.__latency = latency
+        else:
+            self.__latency += (latency - self.__latency) * 0.2
+
+    def add_dropped(self, frames: int) -> None:
+        self.__dropped += frames
+
+    def add_held(self) -> None:
+        self.__held += 1
+
+    def add_late(self) -> None:
+        self.__late += 1
+
+    def clear(self) -> None:
+        self.__drifts.clear()
+        self.__frames = 0
+        self.__dropped = 0
+        self.__held = 0
+        self.__late = 0
+        self.__latency = 0.0
+
+    def get_stats(self) -> dict[str, int | float | None]:
+        # the drifts are in milliseconds, p95 and max are absolute values
+        drifts = np.fromiter(self.__drifts, dtype=np.float64, count=len(self.__drifts)) * 1000
+        abs_drifts = np.abs(drifts)
+
+        return {
+            'frames': self.__frames,
+            'mean': float(drifts.mean()) if len(drifts) else None,
+            'p95': float(np.percentile(abs_drifts, 95)) if len(drifts) else None,
+            'max': float(abs_drifts.max()) if len(drifts) else None,
+            'latency': self.__latency * 1000,
+            'dropped': self.__dropped,
+            'held': self.__held,
+            'late': self.__late
+        }
+
+    @property
+    def latency(self) -> float:
+        return self.__latency
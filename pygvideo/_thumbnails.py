@@ -0,0 +1,117 @@
+import subprocess as sp
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from moviepy.config import FFMPEG_BINARY
+from moviepy.tools import (
+    cross_platform_popen_params,
+    ffmpeg_escape_filename
+)
+from ._utils import (
+    PathL as Path,
+    os
+)
+from . import _utils
+
+def decode_keyframe(filename: _utils.Path,
+                    time: _utils.SecondsValue,
+                    size: tuple[int, int],
+                    resize_algo: str = 'bicubic') -> np.ndarray | None:
+
+    # decode only the keyframes (skip_frame nokey), the seek lands on the keyframe at the time so a single
+    # frame is decoded. 0.0005 so the keyframe isn't dropped by rounding the time
+    width, height = size
+    cmd = [
+        FFMPEG_BINARY,
+        '-loglevel', 'error',
+        '-skip_frame', 'nokey',
+        '-ss', '%.06f' % max(time - 0.0005, 0),
+        '-i', ffmpeg_escape_filename(filename),
+        '-map', '0:v:0',
+        '-frames:v', '1',
+        '-f', 'image2pipe',
+        '-vf', f'scale={width}:{height}',
+        '-sws_flags', resize_algo,
+        '-pix_fmt', 'rgb24',
+        '-vcodec', 'rawvideo',
+        '-'
+    ]
+    popen_params = cross_platform_popen_params(
+        {
+            'stdout': sp.PIPE,
+            'stderr': sp.DEVNULL,
+            'stdin': sp.DEVNULL
+        }
+    )
+
+    with sp.Popen(cmd, **popen_params) as proc:
+        frame = np.empty((height, width, 3), dtype=np.uint8)
+        read_bytes = proc.stdout.readinto(memoryview(frame).cast('B'))
+
+    return frame if read_bytes == frame.nbytes else None
+
+def decode_keyframes(filename: _utils.Path,
+                     times: list[float],
+                     size: tuple[int, int],
+                     resize_algo: str = 'bicubic',
+                     workers: int | None = None) -> list[np.ndarray | None]:
+
+    # every seek runs in its own ffmpeg process, the threads only wait for the pipes
+    workers = workers or min(len(times), os.cpu_count() or 1)
+
+    with ThreadPoolExecutor(max(workers, 1), thread_name_prefix='pygvideo-thumbnail') as executor:
+        return list(executor.map(lambda time: decode_keyframe(filename, time, size, resize_algo), times))
+
+def get_atlas_rects(count: int,
+                    size: tuple[int, int],
+                    columns: int,
+                    padding: int = 0) -> list[tuple[int, int, int, int]]:
+
+    # tiles are placed from left to right, then top to bottom
+    width, height = size
+    return [
+        (
+            padding + (i % columns) * (width + padding),
+            padding + (i // columns) * (height + padding),
+            width,
+            height
+        )
+        for i in range(count)
+    ]
+
+def make_atlas(frames: list[np.ndarray | None],
+               size: tuple[int, int],
+               columns: int,
+               padding: int = 0,
+               color: tuple[int, int, int] = (0, 0, 0)) -> np.ndarray:
+
+    width, height = size
+    rows = -(-len(frames) // columns)
+    atlas = np.empty((padding + rows * (height + padding), padding + columns * (width + padding), 3), dtype=np.uint8)
+    atlas[...] = color
+
+    for frame, (x, y, _, _) in zip(frames, get_atlas_rects(len(frames), size, columns, padding)):
+        # frames that can't be decoded are left in the background color
+        if frame is not None:
+            atlas[y:y + height, x:x + width] = frame[:, :, :3]
+
+    return atlas
+
+def load_atlas(file: _utils.Path) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+    try:
+        with np.load(file) as data:
+            return (data['atlas'], data['times'], data['rects'])
+    except (OSError, ValueError, KeyError):
+        return None
+
+def save_atlas(file: _utils.Path, atlas: np.ndarray, times: np.ndarray, rects: np.ndarray) -> None:
+    file = Path(file)
+
+    try:
+        file.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first, so a broken atlas is never loaded
+        temp_file = Path(f'{file}.tmp.npz')
+        np.savez(temp_file, atlas=atlas, times=times, rects=rects)
+        os.replace(temp_file, file)
+    except OSError:
+        # the atlas can still be used without saving it
+        pass
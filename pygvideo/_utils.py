@@ -1,4 +1,6 @@
 import os
+import re
+import sys
 import typing
 from pathlib import Path as PathL
 from moviepy import (
@@ -23,6 +25,15 @@ IntSecondsValue = int
 IntMilisecondsValue = int
 SecondsValue = FloatSecondsValue | IntSecondsValue
 MilisecondsValue = FloatMilisecondsValue | IntMilisecondsValue
+CacheSize = bool | int | str
+ColorValue = str | tuple[int, int, int] | tuple[int, int, int, int]
+
+BYTE_UNITS = {
+    'b': 1,
+    'kb': 1_024,
+    'mb': 1_048_576,
+    'gb': 1_073_741_824
+}
 
 def _raised(exception, from_exception) -> None:
     if from_exception:
@@ -38,6 +49,38 @@ def asserter(condition: bool, exception: Excepts | str, from_exception: Excepts
 def name(obj: typing.Any) -> str:
     return type(obj).__name__
 
+def parse_bytes(size: str) -> int:
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([kmg]?b)\s*', size.lower())
+
+    asserter(
+        match is not None,
+        ValueError(f'invalid size {size!r}, size must be a number with unit b, kb, mb or gb (e.g. 512MB)')
+    )
+
+    return int(float(match.group(1)) * BYTE_UNITS[match.group(2)])
+
+def get_cache_dir() -> PathL:
+    # persistent cache directory (frame store, shared audio, etc.), by default the cache directory of the user
+    if 'PYGAME_VIDEO_CACHE' in os.environ:
+        return PathL(os.environ['PYGAME_VIDEO_CACHE'])
+
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or PathL.home() / 'AppData' / 'Local'
+        return PathL(base) / 'pygvideo' / 'Cache'
+
+    if sys.platform == 'darwin':
+        return PathL.home() / 'Library' / 'Caches' / 'pygvideo'
+
+    return PathL(os.environ.get('XDG_CACHE_HOME') or PathL.home() / '.cache') / 'pygvideo'
+
+def get_audio_cache_size() -> int:
+    # maximum size of the cached audio files in the cache directory
+    return parse_bytes(os.environ.get('PYGAME_VIDEO_AUDIO_CACHE_SIZE', '1GB'))
+
+def get_frame_store_size() -> int:
+    # maximum size of the frame stores in the cache directory
+    return parse_bytes(os.environ.get('PYGAME_VIDEO_FRAME_STORE_SIZE', '4GB'))
+
 def get_save_value(value: Number, nmax: Number, nmin: Number) -> Number:
     return min(nmax, max(nmin, value))
 
@@ -55,7 +98,8 @@ class GlobalVideo(list['Video']):
             super().append(object)
 
     def is_temp_audio_used(self, filename: Path) -> bool:
-        return any(v.get_temp_audio() == filename for v in self)
+        # the temporary audio file reserved by each open video, get_temp_audio returns the shared audio file instead
+        return any(not v.is_quit and getattr(v, '_Video__temp_audio_file', None) == filename for v in self)
 
     def is_any_video_ready(self) -> bool:
         return any(v.is_ready for v in self)
\ No newline at end of file